@@ -182,3 +182,21 @@ def test_yaml():
     sim.to_yaml(path1)
     sim1 = Simulation.from_yaml(path1)
     assert sim1 == sim
+
+
+@clear_tmp
+def test_load_repeated_components_independent():
+    """Repeated components parsed once when loading should not be shared between or within
+    loaded simulations."""
+    path = "tests/tmp/simulation.json"
+    sim = SIM.copy(update=dict(boundary_spec=BoundarySpec.all_sides(boundary=PML())))
+    sim.to_file(path)
+    sim1 = Simulation.from_file(path)
+    sim2 = Simulation.from_file(path)
+    assert sim1 == sim
+    sim1.boundary_spec.x.plus.num_layers = 20
+    sim1.boundary_spec.x.plus.parameters.sigma_order = 5
+    assert sim1.boundary_spec.x.minus == sim.boundary_spec.x.minus
+    assert sim1.boundary_spec.y.plus.parameters == sim.boundary_spec.y.plus.parameters
+    assert sim2 == sim
+    assert Simulation.from_file(path) == sim
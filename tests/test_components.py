@@ -442,6 +442,17 @@ def test_medium():
         m = Medium(conductivity=-1.0)
 
 
+def test_medium_not_shared():
+    """Equal mediums given to different structures stay independent when one is modified."""
+    s1 = Structure(geometry=Box(size=(1, 1, 1)), medium=Medium(permittivity=2.0))
+    s2 = Structure(geometry=Box(size=(2, 2, 2)), medium=Medium(permittivity=2.0))
+    assert s1.medium is not s2.medium
+    s1.medium.permittivity = 5.0
+    assert s2.medium.permittivity == 2.0
+    s3 = Structure(geometry=Box(size=(1, 1, 1)), medium=Medium(permittivity=2.0))
+    assert s3.medium.permittivity == 2.0
+
+
 def test_medium_conversions():
     n = 4.0
     k = 1.0
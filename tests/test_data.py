@@ -20,6 +20,36 @@ def test_scalar_field_data():
     data.data
 
 
+def test_data_array_cached():
+    f = np.linspace(1e14, 2e14, 11)
+    x = np.linspace(-1, 1, 10)
+    y = np.linspace(-2, 2, 20)
+    z = np.linspace(0, 0, 1)
+    values = (1 + 1j) * np.random.random((len(x), len(y), len(z), len(f)))
+    data = ScalarFieldData(values=values, x=x, y=y, z=z, f=f)
+    data_array = data.data
+    assert data.data is data_array
+
+    # in-place normalization is seen by the cached data array
+    data.normalize(2.0)
+    assert np.allclose(data.data.values, data.values)
+
+    # reassigning or updating a field makes a new data array
+    data.values = 2 * data.values
+    assert data.data is not data_array
+    assert np.allclose(data.data.values, data.values)
+    data_copy = data.copy(update=dict(f=f + 1e12))
+    assert np.allclose(data_copy.data.f, f + 1e12)
+
+    # copies do not carry the cached data array over
+    data.data
+    assert data.copy()._data_array_cache is None
+    assert data.copy(deep=False)._data_array_cache is None
+    assert data._data_array_cache is not None
+    field_data = FieldData(data_dict={"Ex": data})
+    assert field_data.copy().data_dict["Ex"]._data_array_cache is None
+
+
 def test_scalar_field_time_data():
     t = np.linspace(0, 1e-12, 1001)
     x = np.linspace(-1, 1, 10)
@@ -111,7 +141,9 @@ def test_mode_field_data():
     values = (1 + 1j) * np.random.random((len(x), len(y), len(z), len(f), len(mode_index)))
     field = ScalarModeFieldData(values=values, x=x, y=y, z=z, f=f, mode_index=mode_index)
     data = ModeFieldData(data_dict={"Ex": field, "Ey": field})
-    data.sel_mode_index(1)
+    field_data = data.sel_mode_index(1)
+    assert isinstance(field_data.data_dict["Ex"], ScalarFieldData)
+    assert np.all(field_data.Ex.values == data.Ex.sel(mode_index=1).values)
 
 
 def make_sim_data():
@@ -178,6 +210,126 @@ def test_sim_data():
     # assert sim_data == sim_data2
 
 
+def test_interp_out_of_range():
+
+    sim_data = make_sim_data()
+    f0 = float(sim_data["test"].Ex.f[0])
+
+    # colocating outside of the data range is an error
+    with pytest.raises(ValueError):
+        sim_data["test"].colocate(x=[0, 2], y=0, z=0)
+
+    # plotting outside of the data range plots NaN, as with xarray's interp
+    sim_data.plot_field("test", "Ex", val="real", x=2, freq=f0)
+    values = sim_data["test"].Ex.values
+    coords = np.linspace(-1, 1, 10)
+    values_new = td.components.data._interp_linear(
+        values, coords, [0, 2], axis=0, bounds_error=False
+    )
+    assert np.allclose(values_new[0], sim_data["test"].Ex.interp(x=0).values)
+    assert np.all(np.isnan(values_new[1]))
+
+
+@clear_tmp
+def test_sim_data_compressed():
+    sim_data = make_sim_data()
+    sim_data.to_file("tests/tmp/sim_data_compressed.hdf5", compress=True)
+    sim_data2 = SimulationData.from_file("tests/tmp/sim_data_compressed.hdf5", normalize_index=None)
+    for field_name in ("Ex", "Ey", "Ez", "Hx", "Hy", "Hz"):
+        values = sim_data.monitor_data["test"].data_dict[field_name].values
+        assert np.all(sim_data2.monitor_data["test"].data_dict[field_name].values == values)
+
+
+def test_final_decay_value():
+    sim_data = make_sim_data()
+    assert sim_data.final_decay_value == 1.0
+    log_string = (
+        "- Time step    413 / time 2.07e-14s (  2 % done), field decay: 1.000e+00\n"
+        "- Time step    827 / time 4.13e-14s (  4 % done), field decay: 0.110e+00\n"
+        "Field decay smaller than shutoff factor, exiting solver.\n"
+    )
+    sim_data = sim_data.copy(update=dict(log_string=log_string))
+    assert isinstance(sim_data.final_decay_value, float)
+    assert sim_data.final_decay_value == 0.11
+
+    sim_data = sim_data.copy(update=dict(log_string="field decay: nan%\n"))
+    with pytest.raises(DataError):
+        sim_data.final_decay_value
+
+
+def test_from_validated_dict():
+    sim_data = make_sim_data()
+    field_data = sim_data.monitor_data["test"]
+    field_data2 = FieldData.from_validated_dict(field_data.dict())
+    assert field_data2 == field_data
+    for field_name, scalar_data in field_data2.data_dict.items():
+        assert type(scalar_data) is type(field_data.data_dict[field_name])
+
+
+def test_from_validated_dict_nested():
+    sim_data = make_sim_data()
+    sim = sim_data.simulation.copy(update=dict(symmetry=(1, -1, 0)))
+    field_data = sim_data.monitor_data["test"].copy()
+    field_data.set_symmetry_attrs(sim, "test")
+    field_data2 = FieldData.from_validated_dict(field_data.dict())
+    assert isinstance(field_data2.expanded_grid["Ex"], Coords)
+    assert field_data2.expand_syms == field_data.expand_syms
+
+    sim_data = sim_data.copy(update=dict(simulation=sim))
+    sim_data2 = SimulationData.from_validated_dict(sim_data.dict())
+    assert sim_data2 == sim_data
+    assert isinstance(sim_data2.simulation.sources[0].source_time, td.GaussianPulse)
+    assert sim_data2["test"] == sim_data["test"]
+
+
+def test_sim_data_monitor_data_from_dict():
+    sim_data = make_sim_data()
+    monitor_data = {name: data.dict() for name, data in sim_data.monitor_data.items()}
+    sim_data_dict = SimulationData(simulation=sim_data.simulation, monitor_data=monitor_data)
+    for name, data in sim_data.monitor_data.items():
+        assert type(sim_data_dict.monitor_data[name]) is type(data)
+
+
+def test_field_precision():
+    x = np.linspace(-1, 1, 10)
+    y = np.linspace(-2, 2, 20)
+    z = np.linspace(0, 0, 1)
+    f = np.linspace(1e14, 2e14, 3)
+    t = np.linspace(0, 1e-12, 4)
+    values_f = np.random.random((len(x), len(y), len(z), len(f))) + 1j
+    values_t = np.random.random((len(x), len(y), len(z), len(t)))
+    try:
+        td.config.field_precision = "single"
+        data_f = ScalarFieldData(values=values_f, x=x, y=y, z=z, f=f)
+        data_t = ScalarFieldTimeData(values=values_t, x=x, y=y, z=z, t=t)
+        assert data_f.values.dtype == np.complex64
+        assert data_t.values.dtype == np.float32
+        # colocating keeps the precision of the stored data
+        colocated = FieldData(data_dict={"Ex": data_f}).colocate(x=[-0.5, 0.5], y=[0.1], z=[0])
+        assert colocated["Ex"].dtype == np.complex64
+        colocated = FieldTimeData(data_dict={"Ex": data_t}).colocate(x=[-0.5, 0.5], y=[0.1], z=[0])
+        assert colocated["Ex"].dtype == np.float32
+    finally:
+        td.config.field_precision = "double"
+    data_f = ScalarFieldData(values=values_f, x=x, y=y, z=z, f=f)
+    assert data_f.values.dtype == np.complex128
+
+
+def test_sim_data_getitem_no_symmetry():
+    sim_data = make_sim_data()
+    field_data = sim_data["test"]
+    assert field_data == sim_data.monitor_data["test"]
+    assert field_data is not sim_data.monitor_data["test"]
+    assert field_data.expanded_grid == {}
+
+    # changing the returned data in place does not change the stored data
+    values = np.copy(sim_data.monitor_data["test"].data_dict["Ex"].values)
+    field_data.data_dict["Ex"].normalize(2.0)
+    field_data.Ex *= 3.0
+    assert np.all(sim_data.monitor_data["test"].data_dict["Ex"].values == values)
+    assert np.all(sim_data["test"].Ex.values == values)
+
+
 def test_symmetries():
     f = np.linspace(1e14, 2e14, 1001)
     x = np.linspace(-1, 1, 10)
@@ -8,6 +8,7 @@ import tidy3d as td
 from tidy3d.plugins import DispersionFitter
 from tidy3d.plugins.webplots import SimulationPlotly, SimulationDataApp
 from tidy3d.plugins import ModeSolver
+from tidy3d.plugins.mode.solver import compute_modes
 from tidy3d.plugins import Near2Far
 from tidy3d import FieldData, ScalarFieldData, FieldMonitor
 from tidy3d.plugins.smatrix.smatrix import Port
@@ -71,6 +72,18 @@ def test_near2far():
     n2f.fields_spherical(1, pts2, pts3)
     n2f.fields_cartesian(pts1, pts2, pts3)
 
+    # single precision integrals agree with double precision
+    n2f_single = Near2Far.from_surface_monitors(
+        sim_data=sim_data,
+        monitors=monitors,
+        normal_dirs=["-", "+", "-", "+", "-", "+"],
+        frequency=f0,
+        precision="single",
+    )
+    rcs_double = n2f.radar_cross_section(pts1, pts2).values
+    rcs_single = n2f_single.radar_cross_section(pts1, pts2).values
+    assert np.allclose(rcs_single, rcs_double, rtol=1e-4)
+
 
 def test_mode_solver():
     """make sure mode solver runs"""
@@ -97,6 +110,29 @@ def test_mode_solver():
     modes = ms.solve()
 
 
+def test_mode_solver_single_precision():
+    """make sure the mode solver in single precision agrees with double precision"""
+    eps_cross = np.ones((3, 40, 30))
+    eps_cross[:, 15:25, 10:20] = 4.0
+    coords = [np.linspace(-1, 1, 41), np.linspace(-1, 1, 31)]
+    mode_spec = td.ModeSpec(num_modes=2, target_neff=2.0)
+    freq = td.constants.C_0 / 1.0
+    _, n_double = compute_modes(eps_cross, coords, freq, mode_spec)
+    fields, n_single = compute_modes(eps_cross, coords, freq, mode_spec, precision="single")
+    assert fields.dtype == np.complex64
+    assert np.allclose(n_double, n_single, atol=1e-3)
+
+
+def test_mode_solver_all_pec():
+    """make sure the mode solver does not run without a target if the plane is all PEC"""
+    eps_cross = td.constants.pec_val * np.ones((3, 40, 30))
+    coords = [np.linspace(-1, 1, 41), np.linspace(-1, 1, 31)]
+    mode_spec = td.ModeSpec(num_modes=2)
+    freq = td.constants.C_0 / 1.0
+    with pytest.raises(ValueError, match="target_neff"):
+        compute_modes(eps_cross, coords, freq, mode_spec)
+
+
 def _test_coeffs():
     """make sure pack_coeffs and unpack_coeffs are reciprocal"""
     num_poles = 10
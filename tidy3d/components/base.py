@@ -1,6 +1,7 @@
 """global configuration / base class for pydantic models used to make simulation."""
 
 import json
+import threading
 from functools import wraps
 
 import rich
@@ -18,6 +19,20 @@ INDENT = 4
 # type tag default name
 TYPE_TAG_STR = "type"
 
+# per-thread memo of the ``Tidy3dBaseModel.parse_obj`` call in progress, if any: maps
+# (component class, sorted json string of raw dict) to the validated component instance
+_PARSE_MEMO = threading.local()
+
+
+def _copy_components(component: "Tidy3dBaseModel") -> "Tidy3dBaseModel":
+    """Shallow copy of a component and of any component it holds as a field, without validation."""
+    nested = {
+        name: _copy_components(value)
+        for name, value in component.__dict__.items()
+        if isinstance(value, Tidy3dBaseModel)
+    }
+    return component.copy(deep=False, update=nested)
+
 
 class Tidy3dBaseModel(pydantic.BaseModel):
     """Base pydantic model that all Tidy3d components inherit from.
@@ -27,12 +42,58 @@ class Tidy3dBaseModel(pydantic.BaseModel):
     `Pydantic Models <https://pydantic-docs.helpmanual.io/usage/models/>`_
     """
 
+    _cache_parse = False
+    """ explanation of ``_cache_parse``
+        If ``True``, sub-components of this class parsed from a raw dictionary within a single
+        ``parse_obj`` call (such as when loading from file) are memoized by the dictionary
+        contents, so that identical entries (such as the six PML edges of a :class:`.Simulation`)
+        are only validated once. Repeated entries receive shallow copies of the first one, so no
+        instance is shared between components. Should only be set for small, leaf components.
+    """
+
     def __init_subclass__(cls):
         """Things that are done to each of the models."""
 
         add_type_field(cls)
         cls.__doc__ = generate_docstring(cls)
 
+    @classmethod
+    def validate(cls, value):
+        """Validate a field value into this class, copying an instance parsed earlier in the same
+        ``parse_obj`` call for classes with ``_cache_parse`` set."""
+
+        memo = getattr(_PARSE_MEMO, "memo", None)
+        if memo is None or not cls._cache_parse or not isinstance(value, dict):
+            return super().validate(value)
+
+        try:
+            cache_key = (cls, json.dumps(value, sort_keys=True))
+        except (TypeError, ValueError):
+            # contents not json serializable (eg. numpy arrays), just validate normally
+            return super().validate(value)
+
+        cached_value = memo.get(cache_key)
+        if cached_value is not None:
+            return _copy_components(cached_value)
+
+        new_value = super().validate(value)
+        memo[cache_key] = new_value
+        return new_value
+
+    @classmethod
+    def parse_obj(cls, obj, **kwargs):
+        """Parse a raw dictionary into this class, validating identical sub-components with
+        ``_cache_parse`` set only once within the call."""
+
+        if getattr(_PARSE_MEMO, "memo", None) is not None:
+            return super().parse_obj(obj, **kwargs)
+
+        _PARSE_MEMO.memo = {}
+        try:
+            return super().parse_obj(obj, **kwargs)
+        finally:
+            _PARSE_MEMO.memo = None
+
     class Config:  # pylint: disable=too-few-public-methods
         """Sets config for all :class:`Tidy3dBaseModel` objects.
 
@@ -89,7 +150,7 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         fname : str
             Full path to the .yaml or .json file to load the :class:`Tidy3dBaseModel` from.
         **parse_kwargs
-            Keyword arguments passed to either pydantic's ``parse_file`` or ``parse_raw`` methods
+            Keyword arguments passed to either pydantic's ``parse_file`` or ``parse_obj`` methods
             for ``.json`` and ``.yaml`` file formats, respectively.
         Returns
         -------
@@ -163,15 +224,15 @@ class Tidy3dBaseModel(pydantic.BaseModel):
             file_handle.write(json_string)
 
     @classmethod
-    def from_yaml(cls, fname: str, **parse_raw_kwargs):
+    def from_yaml(cls, fname: str, **parse_obj_kwargs):
         """Loads :class:`Tidy3dBaseModel` from .yaml file.
 
         Parameters
         ----------
         fname : str
             Full path to the .yaml file to load the :class:`Tidy3dBaseModel` from.
-        **parse_raw_kwargs
-            Keyword arguments passed to pydantic's ``parse_raw`` method.
+        **parse_obj_kwargs
+            Keyword arguments passed to pydantic's ``parse_obj`` method.
 
         Returns
         -------
@@ -184,8 +245,7 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         """
         with open(fname, "r", encoding="utf-8") as yaml_in:
             json_dict = yaml.safe_load(yaml_in)
-        json_raw = json.dumps(json_dict, indent=INDENT)
-        return cls.parse_raw(json_raw, **parse_raw_kwargs)
+        return cls.parse_obj(json_dict, **parse_obj_kwargs)
 
     def to_yaml(self, fname: str) -> None:
         """Exports :class:`Tidy3dBaseModel` instance to .yaml file.
@@ -182,6 +182,8 @@ class PMLParams(AbsorberParams):
     >>> params = PMLParams(sigma_order=3, sigma_min=0.0, sigma_max=1.5, kappa_min=0.0)
     """
 
+    _cache_parse = True
+
     kappa_order: pd.NonNegativeInt = pd.Field(
         3,
         title="Kappa Order",
@@ -262,6 +264,8 @@ class PML(AbsorberSpec):
     >>> pml = PML(num_layers=10)
     """
 
+    _cache_parse = True
+
     num_layers: pd.NonNegativeInt = pd.Field(
         12,
         title="Number of Layers",
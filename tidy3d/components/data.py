@@ -4,6 +4,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Union, Optional, Tuple
 import logging
+import re
 
 import xarray as xr
 import numpy as np
@@ -35,6 +36,13 @@ DIM_ATTRS = {
 }
 
 
+# hdf5 dataset options used to compress monitor data values (LZF filter is bundled with h5py)
+HDF5_COMPRESSION_KWARGS = {"chunks": True, "compression": "lzf", "shuffle": True}
+
+# matches the field decay value reported at the end of a time step line in the simulation log
+FIELD_DECAY_REGEX = re.compile(r"field decay: (\S*)")
+
+
 """ xarray subclasses """
 
 
@@ -52,6 +60,48 @@ class Tidy3dDataArray(xr.DataArray):
 """ Base data classes """
 
 
+def _model_types(field_type) -> Tuple[type, ...]:
+    """Model classes that a field annotated with ``field_type`` (or with a union of types) can
+    hold, along with all of their subclasses."""
+    if getattr(field_type, "__origin__", None) is Union:
+        candidates = field_type.__args__
+    else:
+        candidates = (field_type,)
+    model_types = []
+    candidates = [c for c in candidates if isinstance(c, type) and issubclass(c, pd.BaseModel)]
+    while candidates:
+        model_type = candidates.pop()
+        model_types.append(model_type)
+        candidates += model_type.__subclasses__()
+    return tuple(model_types)
+
+
+def _construct_value(value, model_types: Tuple[type, ...]):
+    """Construct the dictionaries in a field value that are tagged with one of ``model_types``,
+    recursing into sequences and untagged dictionaries."""
+    if isinstance(value, (list, tuple)):
+        return type(value)(_construct_value(val, model_types) for val in value)
+    if not isinstance(value, dict):
+        return value
+    type_tag = value.get(TYPE_TAG_STR)
+    for model_type in model_types:
+        if model_type.__name__ == type_tag:
+            return _construct_model(model_type, value)
+    return {key: _construct_value(val, model_types) for key, val in value.items()}
+
+
+def _construct_model(model_type: type, values: dict) -> pd.BaseModel:
+    """Construct ``model_type`` from the ``.dict()`` of a validated instance, including all nested
+    models, without validation."""
+    fields = model_type.__fields__
+    return model_type.construct(
+        **{
+            key: _construct_value(val, _model_types(fields[key].type_)) if key in fields else val
+            for key, val in values.items()
+        }
+    )
+
+
 class Tidy3dBaseDataModel(Tidy3dBaseModel):
     """Tidy3dBaseModel, but with yaml and json IO methods disabled."""
 
@@ -75,12 +125,33 @@ class Tidy3dBaseDataModel(Tidy3dBaseModel):
         )
 
     @classmethod
-    def from_yaml(cls, fname: str, **parse_raw_kwargs):
+    def from_yaml(cls, fname: str, **parse_obj_kwargs):
         """Disable loading from yaml file."""
         raise DataError(
             "Can't load Tidy3dData from .yaml file, use `.from_file(fname.hdf5)` instead."
         )
 
+    @classmethod
+    def from_validated_dict(cls, data_dict: dict) -> "Tidy3dBaseDataModel":
+        """Construct from the ``.dict()`` of an already validated instance, skipping validation.
+        Nested dictionaries are constructed as the component class given by their type tag,
+        among the types allowed by the field holding them. The arrays in ``data_dict`` are not
+        copied, as with ``.copy()``.
+
+        Parameters
+        ----------
+        data_dict : dict
+            Output of ``.dict()`` called on a validated instance of this class,
+            optionally with some values replaced by ones of the same type and shape.
+
+        Returns
+        -------
+        :class:`Tidy3dBaseDataModel`
+            An instance of ``cls`` holding the contents of ``data_dict``.
+        """
+
+        return _construct_model(cls, data_dict)
+
 
 class Tidy3dData(Tidy3dBaseDataModel):
     """Base class for data associated with a simulation."""
@@ -100,7 +171,7 @@ class Tidy3dData(Tidy3dBaseDataModel):
         }
 
     @abstractmethod
-    def add_to_group(self, hdf5_grp):
+    def add_to_group(self, hdf5_grp, compress: bool = False):
         """Add data contents to an hdf5 group."""
 
     @property
@@ -178,6 +249,14 @@ class MonitorData(Tidy3dData, ABC):
         attribute to use for the keys in the `coords` coordinate dictionary.
     """
 
+    _data_array_cache: Tuple[tuple, Tidy3dDataArray] = pd.PrivateAttr(None)
+
+    """ explanation of ``_data_array_cache``
+        Stores the :class:`Tidy3dDataArray` returned by ``.data`` together with the ``values``,
+        ``data_attrs`` and coordinate objects it was made from, so that repeated access (such as
+        ``field_data.Ex``) does not rebuild it. It is remade if any of those fields are reassigned.
+    """
+
     @property
     def data(self) -> Tidy3dDataArray:
         """Returns an xarray representation of the montitor data.
@@ -189,9 +268,15 @@ class MonitorData(Tidy3dData, ABC):
             For more details refer to `xarray's Documentaton <https://tinyurl.com/2zrzsp7b>`_.
         """
 
+        # reuse the DataArray made on a previous access if the arrays it was made from are unchanged
+        coords = {dim: getattr(self, dim) for dim in self._dims}
+        fields = (self.values, self.data_attrs, *coords.values())
+        if self._data_array_cache is not None:
+            cached_fields, cached_data_array = self._data_array_cache
+            if all(field is cached_field for field, cached_field in zip(fields, cached_fields)):
+                return cached_data_array
+
         # make DataArray
-        data_dict = self.dict()
-        coords = {dim: data_dict[dim] for dim in self._dims}
         data_array = Tidy3dDataArray(self.values, coords=coords, dims=self._dims)
 
         # assign attrs for xarray
@@ -200,8 +285,26 @@ class MonitorData(Tidy3dData, ABC):
         for name, coord in data_array.coords.items():  # pylint:disable=no-member
             coord[name].attrs = DIM_ATTRS.get(name)
 
+        self._data_array_cache = (fields, data_array)
         return data_array
 
+    def copy(self, deep: bool = True, **kwargs) -> "MonitorData":
+        """Copy a :class:`MonitorData`. The DataArray cached by ``.data`` is not carried over, so
+        that the copy does not keep it (or a deep copy of it) alive."""
+        data_array_cache = self._data_array_cache
+        self._data_array_cache = None
+        try:
+            return super().copy(deep=deep, **kwargs)
+        finally:
+            self._data_array_cache = data_array_cache
+
+    def __getstate__(self):
+        """State used for pickling and deep copies, such as of a collection holding this data,
+        without the DataArray cached by ``.data``."""
+        state = super().__getstate__()
+        state["__private_attribute_values__"]["_data_array_cache"] = None
+        return state
+
     def __eq__(self, other) -> bool:
         """Check equality against another MonitorData instance.
 
@@ -218,16 +321,21 @@ class MonitorData(Tidy3dData, ABC):
         assert isinstance(other, MonitorData), "can only check eqality on two monitor data objects"
         return np.all(self.values == other.values)
 
-    def add_to_group(self, hdf5_grp) -> None:
-        """Add data contents to an hdf5 group."""
+    def add_to_group(self, hdf5_grp, compress: bool = False) -> None:
+        """Add data contents to an hdf5 group, optionally compressing the values."""
 
         # save the type information of MonitorData to the group
         Tidy3dData.save_string(hdf5_grp, TYPE_TAG_STR, self.type)  # pylint:disable=no-member
         for data_name, data_value in self.dict().items():
 
             # for each data member in self._dims (+ values), add to group.
-            if data_name in self._dims or data_name in ("values",):
+            if data_name in self._dims:
                 hdf5_grp.create_dataset(data_name, data=data_value)
+            elif data_name == "values":
+                compress_kwargs = {}
+                if compress and np.ndim(data_value) > 0:
+                    compress_kwargs = HDF5_COMPRESSION_KWARGS
+                hdf5_grp.create_dataset(data_name, data=data_value, **compress_kwargs)
 
     @classmethod
     def load_from_group(cls, hdf5_grp):
@@ -314,7 +422,7 @@ class CollectionData(Tidy3dData):
             raise DataError(f"field_name '{field_name}' not found")
         return monitor_data.data
 
-    def add_to_group(self, hdf5_grp) -> None:
+    def add_to_group(self, hdf5_grp, compress: bool = False) -> None:
         """Add data from a :class:`AbstractFieldData` to an hdf5 group ."""
 
         # put collection's type information into the group
@@ -323,7 +431,7 @@ class CollectionData(Tidy3dData):
 
             # create a new group for each member of collection and add its data
             data_grp = hdf5_grp.create_group(data_name)
-            data_value.add_to_group(data_grp)
+            data_value.add_to_group(data_grp, compress=compress)
 
     @classmethod
     def load_from_group(cls, hdf5_grp):
@@ -355,6 +463,56 @@ class CollectionData(Tidy3dData):
 """ Abstract subclasses of MonitorData and CollectionData """
 
 
+def _interp_linear(
+    values: Numpy, coords: Numpy, coords_new: Numpy, axis: int, bounds_error: bool = True
+) -> Numpy:
+    """Linearly interpolate ``values`` sampled at ``coords`` along ``axis`` to ``coords_new``.
+    The weights are computed once for the axis and applied to the whole array at a time.
+    ``coords`` must be sorted. Coordinates in ``coords_new`` outside of the range of ``coords``
+    raise a ``ValueError`` if ``bounds_error``, otherwise they are filled with NaN, as with
+    xarray's ``interp``.
+    """
+    coords = np.asarray(coords)
+    coords_new = np.asarray(coords_new)
+    out_of_bounds = (coords_new < coords[0]) | (coords_new > coords[-1])
+    if bounds_error and np.any(out_of_bounds):
+        raise ValueError(
+            f"Can not interpolate to coordinates outside of the data range "
+            f"[{coords[0]}, {coords[-1]}]."
+        )
+
+    # index of the data point to the left of each new coordinate, and the weight of the right one
+    inds = np.searchsorted(coords, coords_new, side="right") - 1
+    inds = np.clip(inds, 0, len(coords) - 2)
+    weights = (coords_new - coords[inds]) / (coords[inds + 1] - coords[inds])
+    # match the precision of the data, so that single precision data stays single precision
+    weights = weights.astype(np.real(values).dtype, copy=False)
+    weights_shape = [1] * values.ndim
+    weights_shape[axis] = len(weights)
+    weights = weights.reshape(weights_shape)
+
+    values_left = np.take(values, inds, axis=axis)
+    values_right = np.take(values, inds + 1, axis=axis)
+    values_new = values_left + weights * (values_right - values_left)
+    if np.any(out_of_bounds):
+        values_new[(slice(None),) * axis + (out_of_bounds,)] = np.nan
+    return values_new
+
+
+def _component_property(component_name: str, doc: str) -> property:
+    """Make a property returning the xarray data of ``component_name`` in a collection's
+    ``data_dict``, or ``None`` if the component is not stored."""
+
+    def get_component(self):
+        scalar_data = self.data_dict.get(component_name)
+        if scalar_data:
+            return scalar_data.data
+        return None
+
+    get_component.__doc__ = doc
+    return property(get_component)
+
+
 class SpatialCollectionData(CollectionData, ABC):
     """Sores a collection of scalar data defined over x, y, z (among other) coords."""
 
@@ -397,7 +555,7 @@ class SpatialCollectionData(CollectionData, ABC):
             assert val is not None, "symmetry_center must be supplied."
         return val
 
-    def colocate(self, x, y, z) -> xr.Dataset:
+    def colocate(self, x, y, z) -> xr.Dataset:  # pylint:disable=too-many-locals
         """colocate all of the data at a set of x, y, z coordinates.
 
         Parameters
@@ -424,20 +582,30 @@ class SpatialCollectionData(CollectionData, ABC):
         coord_val_map = {"x": x, "y": y, "z": z}
         centered_data_dict = {}
         for field_name, field_data in self.data_dict.items():
-            centered_data_array = field_data.data
-            interp_dict = {}
+            data_array = field_data.data
+            values = data_array.values
+            coords = {dim: data_array.coords[dim].values for dim in data_array.dims}
+            flat_dims = {}
             for coord_name in "xyz":
-                if len(centered_data_array.coords[coord_name]) <= 1:
-                    # centered_data_array = centered_data_array.isel(**{coord_name:0})
-                    coord_val = coord_val_map[coord_name]
-                    coord_kwargs = {coord_name: coord_val}
-                    centered_data_array = centered_data_array.assign_coords(**coord_kwargs)
-                    centered_data_array = centered_data_array.isel(**{coord_name: 0})
-                else:
-                    interp_dict[coord_name] = coord_val_map[coord_name]
-            centered_data_dict[field_name] = centered_data_array.interp(
-                **interp_dict, kwargs={"bounds_error": True}
+                coord_val = coord_val_map[coord_name]
+                if len(coords[coord_name]) <= 1:
+                    # data is flat along this dimension, just relabel its coordinate and drop it
+                    coords[coord_name] = coord_val
+                    flat_dims[coord_name] = 0
+                    continue
+                if np.ndim(coord_val) == 0:
+                    # a single position drops the dimension, as with xarray's ``interp``
+                    coord_val = np.atleast_1d(coord_val)
+                    flat_dims[coord_name] = 0
+                axis = data_array.get_axis_num(coord_name)
+                values = _interp_linear(values, coords[coord_name], coord_val, axis=axis)
+                coords[coord_name] = coord_val
+            centered_data_array = xr.DataArray(
+                values, coords=coords, dims=data_array.dims, attrs=data_array.attrs
             )
+            for name, coord in centered_data_array.coords.items():  # pylint:disable=no-member
+                coord.attrs = DIM_ATTRS.get(name)
+            centered_data_dict[field_name] = centered_data_array.isel(**flat_dims)
         return xr.Dataset(centered_data_dict)
 
     @property
@@ -453,6 +621,10 @@ class SpatialCollectionData(CollectionData, ABC):
             is non-zero.
         """
 
+        # nothing to expand, a copy of the data is returned without interpolating
+        if not any(self.symmetry):
+            return self.copy()
+
         new_data_dict = {}
 
         for data_key, scalar_data in self.data_dict.items():
@@ -524,53 +696,12 @@ class AbstractFieldData(SpatialCollectionData, ABC):
 
     """ Get the standard EM components from the dict using convenient "dot" syntax."""
 
-    @property
-    def Ex(self):
-        """Get Ex component of field using '.Ex' syntax."""
-        scalar_data = self.data_dict.get("Ex")
-        if scalar_data:
-            return scalar_data.data
-        return None
-
-    @property
-    def Ey(self):
-        """Get Ey component of field using '.Ey' syntax."""
-        scalar_data = self.data_dict.get("Ey")
-        if scalar_data:
-            return scalar_data.data
-        return None
-
-    @property
-    def Ez(self):
-        """Get Ez component of field using '.Ez' syntax."""
-        scalar_data = self.data_dict.get("Ez")
-        if scalar_data:
-            return scalar_data.data
-        return None
-
-    @property
-    def Hx(self):
-        """Get Hx component of field using '.Hx' syntax."""
-        scalar_data = self.data_dict.get("Hx")
-        if scalar_data:
-            return scalar_data.data
-        return None
-
-    @property
-    def Hy(self):
-        """Get Hy component of field using '.Hy' syntax."""
-        scalar_data = self.data_dict.get("Hy")
-        if scalar_data:
-            return scalar_data.data
-        return None
-
-    @property
-    def Hz(self):
-        """Get Hz component of field using '.Hz' syntax."""
-        scalar_data = self.data_dict.get("Hz")
-        if scalar_data:
-            return scalar_data.data
-        return None
+    Ex = _component_property("Ex", "Get Ex component of field using '.Ex' syntax.")
+    Ey = _component_property("Ey", "Get Ey component of field using '.Ey' syntax.")
+    Ez = _component_property("Ez", "Get Ez component of field using '.Ez' syntax.")
+    Hx = _component_property("Hx", "Get Hx component of field using '.Hx' syntax.")
+    Hy = _component_property("Hy", "Get Hy component of field using '.Hy' syntax.")
+    Hz = _component_property("Hz", "Get Hz component of field using '.Hz' syntax.")
 
 
 class FreqData(MonitorData, ABC):
@@ -602,6 +733,12 @@ class TimeData(MonitorData, ABC):
 class ScalarSpatialData(MonitorData, ABC):
     """Stores a single, scalar variable as a function of spatial coordinates x, y, z."""
 
+    _single_precision = False
+
+    """ explanation of ``_single_precision``
+        Whether field values are stored in single precision, set by ``config.field_precision``.
+    """
+
     x: Array[float] = pd.Field(
         ...,
         title="X Locations",
@@ -643,6 +780,14 @@ class AbstractFluxData(PlanarData, ABC):
 """ Usable individual data containers for CollectionData monitors """
 
 
+def _set_field_precision(cls, val: Numpy) -> Numpy:
+    """Cast field values to single precision if ``config.field_precision`` is "single"."""
+    if cls._single_precision:  # pylint:disable=protected-access
+        val = np.asarray(val)
+        return val.astype(np.complex64 if np.iscomplexobj(val) else np.float32)
+    return val
+
+
 class ScalarFieldData(ScalarSpatialData, FreqData):
     """Stores a single scalar field in frequency-domain.
 
@@ -662,6 +807,8 @@ class ScalarFieldData(ScalarSpatialData, FreqData):
         description="Multi-dimensional array storing the raw scalar field values in freq. domain.",
     )
 
+    _field_precision = pd.validator("values", allow_reuse=True)(_set_field_precision)
+
     _dims = ("x", "y", "z", "f")
 
     def normalize(self, source_freq_amps: Array[complex]) -> None:
@@ -688,6 +835,8 @@ class ScalarFieldTimeData(ScalarSpatialData, TimeData):
         description="Multi-dimensional array storing the raw scalar field values in time domain.",
     )
 
+    _field_precision = pd.validator("values", allow_reuse=True)(_set_field_precision)
+
     _dims = ("x", "y", "z", "t")
 
 
@@ -874,29 +1023,9 @@ class PermittivityData(SpatialCollectionData):
 
     """ Get the permittivity components from the dict using convenient "dot" syntax."""
 
-    @property
-    def eps_xx(self):
-        """Get eps_xx component."""
-        scalar_data = self.data_dict.get("eps_xx")
-        if scalar_data:
-            return scalar_data.data
-        return None
-
-    @property
-    def eps_yy(self):
-        """Get eps_yy component."""
-        scalar_data = self.data_dict.get("eps_yy")
-        if scalar_data:
-            return scalar_data.data
-        return None
-
-    @property
-    def eps_zz(self):
-        """Get eps_zz component."""
-        scalar_data = self.data_dict.get("eps_zz")
-        if scalar_data:
-            return scalar_data.data
-        return None
+    eps_xx = _component_property("eps_xx", "Get eps_xx component.")
+    eps_yy = _component_property("eps_yy", "Get eps_yy component.")
+    eps_zz = _component_property("eps_zz", "Get eps_zz component.")
 
     def set_symmetry_attrs(self, simulation: Simulation, monitor_name: str):
         """Set the collection data attributes related to symmetries."""
@@ -1044,8 +1173,8 @@ class ModeFieldData(AbstractFieldData):
             scalar_dict = scalar_data.dict()
             scalar_dict.pop("mode_index")
             scalar_dict.pop(TYPE_TAG_STR)
-            scalar_dict["values"] = scalar_data.data.sel(mode_index=mode_index).values
-            data_dict[field_name] = ScalarFieldData(**scalar_dict)
+            scalar_dict["values"] = np.array(scalar_data.data.sel(mode_index=mode_index).values)
+            data_dict[field_name] = ScalarFieldData.from_validated_dict(scalar_dict)
 
         return FieldData(data_dict=data_dict)
 
@@ -1132,15 +1261,21 @@ class AbstractSimulationData(Tidy3dBaseDataModel, ABC):
 
         # select the cross section data
         axis_label = "xyz"[axis]
-        interp_kwarg = {axis_label: position}
+        coords = field_data.coords[axis_label].values
 
-        if len(field_data.coords[axis_label]) > 1:
+        if len(coords) > 1:
             try:
-                field_data = field_data.interp(**interp_kwarg)
+                axis_num = field_data.get_axis_num(axis_label)
+                values = _interp_linear(
+                    field_data.values, coords, [position], axis=axis_num, bounds_error=False
+                )
 
             except Exception as e:
                 raise DataError(f"Could not interpolate data at {axis_label}={position}.") from e
 
+            field_data = field_data.isel({axis_label: 0}).copy(data=values.squeeze(axis=axis_num))
+            field_data = field_data.assign_coords({axis_label: position})
+
         # select the field value
         if val not in ("real", "imag", "abs"):
             raise DataError(f"'val' must be one of ``{'real', 'imag', 'abs'}``, given {val}")
@@ -1215,6 +1350,19 @@ class SimulationData(AbstractSimulationData):
         "indicating which source normalized the data.",
     """
 
+    @pd.validator("monitor_data", pre=True)
+    def _load_monitor_data_types(cls, val):
+        """Construct monitor data supplied as dictionaries using the class stored in their type
+        tag, looked up directly in ``DATA_TYPE_MAP``."""
+        if not isinstance(val, dict):
+            return val
+        return {
+            monitor_name: DATA_TYPE_MAP[data[TYPE_TAG_STR]](**data)
+            if isinstance(data, dict) and data.get(TYPE_TAG_STR) in DATA_TYPE_MAP
+            else data
+            for monitor_name, data in val.items()
+        }
+
     @property
     def normalized(self) -> bool:
         """Is this data normalized?"""
@@ -1234,15 +1382,15 @@ class SimulationData(AbstractSimulationData):
 
     @property
     def final_decay_value(self) -> float:
-        """Returns value of the field decay at the final time step."""
-        log_str = self.log
-        lines = log_str.split("\n")
-        decay_lines = [l for l in lines if "field decay" in l]
-        final_decay = 1.0
-        if len(decay_lines) > 0:
-            final_decay_line = decay_lines[-1]
-            final_decay = float(final_decay_line.split("field decay: ")[-1])
-        return final_decay
+        """Returns value of the field decay at the final time step, or 1.0 if the log contains no
+        field decay."""
+        decay_values = FIELD_DECAY_REGEX.findall(self.log)
+        if not decay_values:
+            return 1.0
+        try:
+            return float(decay_values[-1])
+        except ValueError as e:
+            raise DataError(f"Could not parse field decay value '{decay_values[-1]}'.") from e
 
     def __getitem__(self, monitor_name: str) -> Union[Tidy3dDataArray, xr.Dataset]:
         """Get the :class:`MonitorData` xarray representation by name (``sim_data[monitor_name]``).
@@ -1261,9 +1409,11 @@ class SimulationData(AbstractSimulationData):
             Otherwise, if it is a MonitorData instance, the xarray representation is returned.
         """
         self.ensure_monitor_exists(monitor_name)
-        monitor_data = self.monitor_data.get(monitor_name)
+        monitor_data = self.monitor_data[monitor_name]
         if isinstance(monitor_data, SpatialCollectionData):
-            monitor_data.set_symmetry_attrs(self.simulation, monitor_name)
+            # without any symmetry, there is no expanded grid to set up
+            if any(self.simulation.symmetry) or any(monitor_data.symmetry):
+                monitor_data.set_symmetry_attrs(self.simulation, monitor_name)
         return monitor_data.sim_data_getitem
 
     def ensure_monitor_exists(self, monitor_name: str) -> None:
@@ -1382,11 +1532,16 @@ class SimulationData(AbstractSimulationData):
         # get the field data component
         if field_name == "int":
             monitor_data = self.at_centers(field_monitor_name)
-            xr_data = 0.0
+            field_data = monitor_data["Ex"]
+            # accumulate |E|^2 in place into a single buffer, without abs() taking a square root
+            intensity = np.zeros(field_data.shape)
             for field in ("Ex", "Ey", "Ez"):
-                field_data = monitor_data[field]
-                xr_data += abs(field_data) ** 2
-                xr_data.name = "Intensity"
+                values = monitor_data[field].transpose(*field_data.dims).values
+                intensity += np.square(values.real)
+                if np.iscomplexobj(values):
+                    intensity += np.square(values.imag)
+            xr_data = field_data.copy(data=intensity)
+            xr_data.name = "Intensity"
             val = "abs"
         else:
             monitor_data.ensure_member_exists(field_name)
@@ -1490,14 +1645,21 @@ class SimulationData(AbstractSimulationData):
         boundaries = [item for boundary in boundaries for item in boundary]
         complex_fields = any(isinstance(item, BlochBoundary) for item in boundaries)
 
+        # source spectra by frequencies, shared by all of the components of a collection
+        source_freq_amps_cache = {}
+
         def normalize_data(monitor_data):
             """normalize a monitor data instance using the source time parameters."""
             freqs = monitor_data.f
-            source_freq_amps = source_time.spectrum(times, freqs, dt, complex_fields)
-            # We remove the user-defined phase from the normalization. Otherwise, with a single
-            # source, we would get the exact same fields regardless of the source_time phase.
-            # Instead we would like the field phase to be determined by the source_time phase.
-            source_freq_amps *= np.exp(-1j * source_time.phase)
+            freqs_key = freqs.tobytes()
+            source_freq_amps = source_freq_amps_cache.get(freqs_key)
+            if source_freq_amps is None:
+                source_freq_amps = source_time.spectrum(times, freqs, dt, complex_fields)
+                # We remove the user-defined phase from the normalization. Otherwise, with a single
+                # source, we would get the exact same fields regardless of the source_time phase.
+                # Instead we would like the field phase to be determined by the source_time phase.
+                source_freq_amps *= np.exp(-1j * source_time.phase)
+                source_freq_amps_cache[freqs_key] = source_freq_amps
             monitor_data.normalize(source_freq_amps)
 
         for monitor_data in sim_data_norm.monitor_data.values():
@@ -1514,13 +1676,17 @@ class SimulationData(AbstractSimulationData):
         sim_data_norm._normalize_index = normalize_index  # pylint:disable=protected-access
         return sim_data_norm
 
-    def to_file(self, fname: str) -> None:
+    def to_file(self, fname: str, compress: bool = False) -> None:
         """Export :class:`SimulationData` to single hdf5 file including monitor data.
 
         Parameters
         ----------
         fname : str
             Path to .hdf5 data file (including filename).
+        compress : bool = False
+            Whether to store the monitor data values in chunked datasets compressed with the LZF
+            filter. This typically makes field data files several times smaller,
+            at the cost of slower writing and reading.
         """
 
         with h5py.File(fname, "a") as f_handle:
@@ -1543,7 +1709,7 @@ class SimulationData(AbstractSimulationData):
 
                 # for each monitor, make new group with the same name
                 mon_grp = mon_data_grp.create_group(mon_name)
-                mon_data.add_to_group(mon_grp)
+                mon_data.add_to_group(mon_grp, compress=compress)
 
     @classmethod
     def from_file(
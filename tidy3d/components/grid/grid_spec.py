@@ -266,6 +266,8 @@ class AutoGrid(GridSpec1d):
     >>> grid_1d = AutoGrid(min_steps_per_wvl=16, max_scale=1.4)
     """
 
+    _cache_parse = True
+
     min_steps_per_wvl: float = pd.Field(
         10.0,
         title="Minimal number of steps per wavelength",
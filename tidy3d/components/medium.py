@@ -247,6 +247,8 @@ class Medium(AbstractMedium):
     >>> eps = dielectric.eps_model(200e12)
     """
 
+    _cache_parse = True
+
     permittivity: float = pd.Field(
         1.0, ge=1.0, title="Permittivity", description="Relative permittivity.", units=PERMITTIVITY
     )
@@ -1758,8 +1758,7 @@ class Simulation(Box):  # pylint:disable=too-many-public-methods
         fname : str
             Full path to the .yaml or .json file to load the :class:`Tidy3dBaseModel` from.
         **parse_kwargs
-            Keyword arguments passed to either pydantic's ``parse_file`` or ``parse_raw`` methods
-            for ``.json`` and ``.yaml`` file formats, respectively.
+            Keyword arguments passed to pydantic's ``parse_obj`` method.
         Returns
         -------
         :class:`Tidy3dBaseModel`
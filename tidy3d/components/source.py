@@ -218,6 +218,8 @@ class GaussianPulse(Pulse):
     >>> pulse = GaussianPulse(freq0=200e12, fwidth=20e12)
     """
 
+    _cache_parse = True
+
     def amp_time(self, time: float) -> complex:
         """Complex-valued source amplitude as a function of time."""
 
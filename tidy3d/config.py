@@ -7,6 +7,7 @@ from typing_extensions import Literal
 
 from .log import set_logging_level, DEFAULT_LEVEL, Tidy3dKeyError
 from .components.base import Tidy3dBaseModel
+from .components.data import ScalarSpatialData
 from .web.config import DEFAULT_CONFIG, WEB_CONFIGS
 
 # set the default web config based on environment variable, if present
@@ -49,6 +50,14 @@ class Tidy3dConfig(pd.BaseModel):
         False, title="Frozen", description="Whether all tidy3d components are immutable."
     )
 
+    field_precision: Literal["double", "single"] = pd.Field(
+        "double",
+        title="Field Precision",
+        description="Floating point precision used to store field monitor data. "
+        '"single" stores the values as ``complex64`` (``float32`` for time-domain data), '
+        "halving the memory used by the field data.",
+    )
+
     @pd.validator("logging_level", always=True)
     def _set_logging_level(cls, val):
         """Set the logging level if logging_level is changed."""
@@ -74,6 +83,12 @@ class Tidy3dConfig(pd.BaseModel):
         Tidy3dBaseModel.__config__.frozen = val
         return val
 
+    @pd.validator("field_precision", always=True)
+    def _set_field_precision(cls, val):
+        """Set the precision used to store field monitor data."""
+        ScalarSpatialData._single_precision = val == "single"  # pylint:disable=protected-access
+        return val
+
 
 # instance of the config that can be modified.
 config = Tidy3dConfig()
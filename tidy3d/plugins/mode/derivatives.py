@@ -77,7 +77,6 @@ def create_s_matrices(omega, shape, npml, dlf, dlb, dmin_pml=(True, True)):
 
     # strip out some information needed
     Nx, Ny = shape
-    N = Nx * Ny
     nx_pml, ny_pml = npml
 
     # Create the sfactor in each direction and for 'f' and 'b'
@@ -107,10 +106,10 @@ def create_s_matrices(omega, shape, npml, dlf, dlb, dmin_pml=(True, True)):
     sy_b_vec = sy_b_2d.flatten()
 
     # Construct the 1D total s-vector into a diagonal matrix
-    sx_f = sp.spdiags(sx_f_vec, 0, N, N)
-    sx_b = sp.spdiags(sx_b_vec, 0, N, N)
-    sy_f = sp.spdiags(sy_f_vec, 0, N, N)
-    sy_b = sp.spdiags(sy_b_vec, 0, N, N)
+    sx_f = sp.diags(sx_f_vec)
+    sx_b = sp.diags(sx_b_vec)
+    sy_f = sp.diags(sy_f_vec)
+    sy_b = sp.diags(sy_b_vec)
 
     return sx_f, sx_b, sy_f, sy_b
 
@@ -12,13 +12,14 @@ from .derivatives import create_s_matrices as s_mats
 from .transforms import radial_transform, angled_transform
 
 
-# pylint:disable=too-many-statements,too-many-branches,too-many-locals
+# pylint:disable=too-many-statements,too-many-branches,too-many-locals,too-many-arguments
 def compute_modes(
     eps_cross,
     coords,
     freq,
     mode_spec,
     symmetry=(0, 0),
+    precision="double",
 ) -> Tuple[Numpy, Numpy]:
     """Solve for the modes of a waveguide cross section.
 
@@ -34,6 +35,10 @@ def compute_modes(
         (Hertz) Frequency at which the eigenmodes are computed.
     mode_spec : ModeSpec
         ``ModeSpec`` object containing specifications of the mode solver.
+    precision : str = "double"
+        Either ``"double"`` or ``"single"``. In single precision, the eigenvalue problem is set up
+        and solved in ``complex64``, which is faster but only accurate to about ``1e-4`` in the
+        effective index.
 
     Returns
     -------
@@ -42,6 +47,9 @@ def compute_modes(
         effective index.
     """
 
+    if precision not in ("double", "single"):
+        raise ValueError(f"'precision' must be 'double' or 'single', got '{precision}'.")
+
     num_modes = mode_spec.num_modes
     bend_radius = mode_spec.bend_radius
     bend_axis = mode_spec.bend_axis
@@ -54,7 +62,7 @@ def compute_modes(
         if isinstance(eps_cross, Numpy):
             eps_xx, eps_yy, eps_zz = eps_cross
         elif len(eps_cross) == 3:
-            eps_xx, eps_yy, eps_zz = [np.copy(e) for e in eps_cross]
+            eps_xx, eps_yy, eps_zz = [np.asarray(e) for e in eps_cross]
         else:
             raise ValueError
     except Exception as e:
@@ -66,29 +74,50 @@ def compute_modes(
 
     if coords[0].size != Nx + 1 or coords[1].size != Ny + 1:
         raise ValueError("Mismatch between 'coords' and 'esp_cross' shapes.")
-    new_coords = [np.copy(c) for c in coords]
+    # the permittivity and coordinate arrays are only read, never modified, so they are not copied
+    new_coords = coords
 
     """We work with full tensorial epsilon in mu to handle the most general cases that can
     be introduced by coordinate transformations. In the solver, we distinguish the case when
     these tensors are still diagonal, in which case the matrix for diagonalization has shape
-    (2N, 2N), and the full tensorial case, in which case it has shape (4N, 4N)."""
-    eps_tensor = np.zeros((3, 3, N), dtype=np.complex128)
-    mu_tensor = np.zeros((3, 3, N), dtype=np.complex128)
+    (2N, 2N), and the full tensorial case, in which case it has shape (4N, 4N). Before the
+    coordinate transformations, eps is diagonal, so only its diagonal is stored here, and mu is
+    the identity."""
+    eps_diag = np.zeros((3, N), dtype=np.complex128)
     for dim, eps in enumerate([eps_xx, eps_yy, eps_zz]):
-        eps_tensor[dim, dim, :] = eps.ravel()
-        mu_tensor[dim, dim, :] = 1.0
-
-    # Get Jacobian of all coordinate transformations. Initialize as identity (same as mu so far)
-    jac_e = np.copy(mu_tensor)
-    jac_h = np.copy(mu_tensor)
-
-    if bend_radius is not None:
-        new_coords, jac_e, jac_h = radial_transform(new_coords, bend_radius, bend_axis)
-
-    if angle_theta > 0:
-        new_coords, jac_e_tmp, jac_h_tmp = angled_transform(new_coords, angle_theta, angle_phi)
-        jac_e = np.einsum("ij...,jp...->ip...", jac_e_tmp, jac_e)
-        jac_h = np.einsum("ij...,jp...->ip...", jac_h_tmp, jac_h)
+        eps_diag[dim, :] = eps.ravel()
+
+    # Without coordinate transformations the Jacobians are the identity, so eps and mu are used
+    # as they are and the fields need no rotation back to the original axes
+    identity_jac = bend_radius is None and angle_theta == 0
+    if identity_jac:
+        eps_tensor = np.zeros((3, 3, N), dtype=np.complex128)
+        eps_tensor[[0, 1, 2], [0, 1, 2], :] = eps_diag
+        mu_tensor = np.zeros((3, 3, N), dtype=np.complex128)
+        mu_tensor[[0, 1, 2], [0, 1, 2], :] = 1.0
+    else:
+        # Get Jacobian of all coordinate transformations. Initialize as identity
+        jac_e = np.zeros((3, 3, N), dtype=np.complex128)
+        for dim in range(3):
+            jac_e[dim, dim, :] = 1.0
+        jac_h = np.copy(jac_e)
+
+        if bend_radius is not None:
+            new_coords, jac_e, jac_h = radial_transform(new_coords, bend_radius, bend_axis)
+
+        if angle_theta > 0:
+            new_coords, jac_e_tmp, jac_h_tmp = angled_transform(new_coords, angle_theta, angle_phi)
+            jac_e = np.einsum("ij...,jp...->ip...", jac_e_tmp, jac_e)
+            jac_h = np.einsum("ij...,jp...->ip...", jac_h_tmp, jac_h)
+
+        # Transform epsilon and mu as J.dot(eps).dot(J.T) / det(J), using that eps is diagonal and
+        # that mu is the identity, such that the transformed mu is just J.dot(J.T) / det(J)
+        jac_e_det = det_3x3(jac_e)
+        jac_h_det = det_3x3(jac_h)
+        eps_tensor = np.einsum("ij...,j...,pj...->ip...", jac_e, eps_diag, jac_e)
+        eps_tensor /= jac_e_det
+        mu_tensor = np.einsum("ij...,pj...->ip...", jac_h, jac_h)
+        mu_tensor /= jac_h_det
 
     """We also need to keep track of the transformation of the k-vector. This is
     the eigenvalue of the momentum operator assuming some sort of translational invariance and is
@@ -104,25 +133,17 @@ def compute_modes(
     kz = np.cos(angle_theta) * np.sin(angle_theta)
     kp_to_k = np.array([kxy * np.sin(angle_phi), kxy * np.cos(angle_phi), kz])
 
-    # Transform epsilon and mu
-    jac_e_det = np.linalg.det(np.moveaxis(jac_e, [0, 1], [-2, -1]))
-    jac_h_det = np.linalg.det(np.moveaxis(jac_h, [0, 1], [-2, -1]))
-    eps_tensor = np.einsum("ij...,jp...->ip...", jac_e, eps_tensor)  # J.dot(eps)
-    eps_tensor = np.einsum("ij...,pj...->ip...", eps_tensor, jac_e)  # (J.dot(eps)).dot(J.T)
-    eps_tensor /= jac_e_det
-    mu_tensor = np.einsum("ij...,jp...->ip...", jac_h, mu_tensor)
-    mu_tensor = np.einsum("ij...,pj...->ip...", mu_tensor, jac_h)
-    mu_tensor /= jac_h_det
-
     """ The forward derivative matrices already impose PEC boundary at the xmax and ymax interfaces.
     Here, we also impose PEC boundaries on the xmin and ymin interfaces through the permittivity at
     those positions, unless a PMC symmetry is specifically requested. The PMC symmetry is
     imposed by modifying the backward derivative matrices."""
     dmin_pmc = [False, False]
+    # Index the edges on the (Nx, Ny) cross-section rather than through strides of the flat axis
+    eps_tensor = eps_tensor.reshape((3, 3, Nx, Ny))
     if symmetry[0] != 1:
         # PEC at the xmin edge
-        eps_tensor[1, 1, :Ny] = pec_val
-        eps_tensor[2, 2, :Ny] = pec_val
+        eps_tensor[1, 1, 0, :] = pec_val
+        eps_tensor[2, 2, 0, :] = pec_val
     else:
         # Modify the backwards x derivative
         dmin_pmc[0] = True
@@ -130,17 +151,20 @@ def compute_modes(
     if Ny > 1:
         if symmetry[1] != 1:
             # PEC at the ymin edge
-            eps_tensor[0, 0, ::Ny] = pec_val
-            eps_tensor[2, 2, ::Ny] = pec_val
+            eps_tensor[0, 0, :, 0] = pec_val
+            eps_tensor[2, 2, :, 0] = pec_val
         else:
             # Modify the backwards y derivative
             dmin_pmc[1] = True
+    eps_tensor = eps_tensor.reshape((3, 3, N))
 
     # Primal grid steps for E-field derivatives
-    dl_f = [new_cs[1:] - new_cs[:-1] for new_cs in new_coords]
+    dl_f = [np.diff(new_cs) for new_cs in new_coords]
     # Dual grid steps for H-field derivatives
-    dl_tmp = [(dl[:-1] + dl[1:]) / 2 for dl in dl_f]
-    dl_b = [np.hstack((d1[0], d2)) for d1, d2 in zip(dl_f, dl_tmp)]
+    dl_b = [np.empty_like(dl) for dl in dl_f]
+    for dl, dl_dual in zip(dl_f, dl_b):
+        dl_dual[0] = dl[0]
+        dl_dual[1:] = (dl[:-1] + dl[1:]) / 2
 
     # Derivative matrices with PEC boundaries at the far end and optional pmc at the near end
     der_mats_tmp = d_mats((Nx, Ny), dl_f, dl_b, dmin_pmc)
@@ -154,14 +178,27 @@ def compute_modes(
 
     # Determine initial guess value for the solver in transformed coordinates
     if mode_spec.target_neff is None:
-        eps_physical = np.array(eps_cross)
-        eps_physical = eps_physical[np.abs(eps_physical) < np.abs(pec_val)]
-        n_max = np.sqrt(np.max(np.abs(eps_physical)))
+        # Largest permittivity magnitude excluding PEC, reduced over each component in turn
+        eps_max = 0
+        for eps in (eps_xx, eps_yy, eps_zz):
+            eps_abs = np.abs(eps)
+            eps_max = max(eps_max, np.max(eps_abs, where=eps_abs < np.abs(pec_val), initial=0))
+        if eps_max == 0:
+            raise ValueError(
+                "No non-PEC permittivity found in the mode plane, can not determine the target "
+                "effective index. Set 'target_neff' in the 'ModeSpec'."
+            )
+        n_max = np.sqrt(eps_max)
         target = n_max
     else:
         target = mode_spec.target_neff
     target_neff_p = target / np.linalg.norm(kp_to_k)
 
+    if precision == "single":
+        eps_tensor = eps_tensor.astype(np.complex64)
+        mu_tensor = mu_tensor.astype(np.complex64)
+        der_mats = [der_mat.astype(np.complex64) for der_mat in der_mats]
+
     # Solve for the modes
     E, H, neff, keff = solver_em(eps_tensor, mu_tensor, der_mats, num_modes, target_neff_p)
 
@@ -177,18 +214,37 @@ def compute_modes(
         neff = neff[..., sort_inds]
         keff = keff[..., sort_inds]
 
-    # Transform back to original axes, E = J^T E'
-    E = np.sum(jac_e[..., None] * E[:, None, ...], axis=0)
-    E = E.reshape((3, Nx, Ny, 1, num_modes))
-    H = np.sum(jac_h[..., None] * H[:, None, ...], axis=0)
-    H = H.reshape((3, Nx, Ny, 1, num_modes))
+    # Transform back to original axes, E = J^T E', writing directly into the output array
+    fields = np.empty((2, 3, N, num_modes), dtype=E.dtype)
+    if identity_jac:
+        fields[0] = E
+        fields[1] = H
+    else:
+        np.einsum("ijn,inm->jnm", jac_e, E, out=fields[0], casting="same_kind")
+        np.einsum("ijn,inm->jnm", jac_h, H, out=fields[1], casting="same_kind")
+    fields = fields.reshape((2, 3, Nx, Ny, 1, num_modes))
     neff = neff * np.linalg.norm(kp_to_k)
 
-    fields = np.stack((E, H), axis=0)
-
     return fields, neff + 1j * keff
 
 
+def det_3x3(mat):
+    """Determinants of a stack of 3x3 matrices of shape (3, 3, N), computed element-wise with the
+    closed-form expression rather than with a LAPACK call per matrix."""
+    return (
+        mat[0, 0] * (mat[1, 1] * mat[2, 2] - mat[1, 2] * mat[2, 1])
+        - mat[0, 1] * (mat[1, 0] * mat[2, 2] - mat[1, 2] * mat[2, 0])
+        + mat[0, 2] * (mat[1, 0] * mat[2, 1] - mat[1, 1] * mat[2, 0])
+    )
+
+
+def scale_cols(mat, vec):
+    """Compute ``mat.dot(diag(vec))`` for a sparse ``mat`` by scaling each stored element with the
+    entry of ``vec`` for its column, without a sparse matrix product."""
+    mat = sp.csr_matrix(mat)
+    return sp.csr_matrix((mat.data * vec[mat.indices], mat.indices, mat.indptr), shape=mat.shape)
+
+
 def solver_em(eps_tensor, mu_tensor, der_mats, num_modes, neff_guess):
     """Solve for the electromagnetic modes of a system defined by in-plane permittivity and
     permeability and assuming translational invariance in the normal direction.
@@ -242,16 +298,21 @@ def solver_diagonal(eps, mu, der_mats, num_modes, neff_guess):
     dxf, dxb, dyf, dyb = der_mats
 
     # Compute the matrix for diagonalization
-    inv_eps_zz = sp.spdiags(1 / eps_zz, [0], N, N)
-    inv_mu_zz = sp.spdiags(1 / mu_zz, [0], N, N)
-    p11 = -dxf.dot(inv_eps_zz).dot(dyb)
-    p12 = dxf.dot(inv_eps_zz).dot(dxb) + sp.spdiags(mu_yy, [0], N, N)
-    p21 = -dyf.dot(inv_eps_zz).dot(dyb) - sp.spdiags(mu_xx, [0], N, N)
-    p22 = dyf.dot(inv_eps_zz).dot(dxb)
-    q11 = -dxb.dot(inv_mu_zz).dot(dyf)
-    q12 = dxb.dot(inv_mu_zz).dot(dxf) + sp.spdiags(eps_yy, [0], N, N)
-    q21 = -dyb.dot(inv_mu_zz).dot(dyf) - sp.spdiags(eps_xx, [0], N, N)
-    q22 = dyb.dot(inv_mu_zz).dot(dxf)
+    inv_eps_zz = sp.diags(1 / eps_zz)
+    inv_mu_zz = sp.diags(1 / mu_zz)
+    # Each derivative scaled by 1 / eps_zz or 1 / mu_zz is used in two blocks, so compute it once
+    dxf_inv_eps_zz = scale_cols(dxf, 1 / eps_zz)
+    dyf_inv_eps_zz = scale_cols(dyf, 1 / eps_zz)
+    dxb_inv_mu_zz = scale_cols(dxb, 1 / mu_zz)
+    dyb_inv_mu_zz = scale_cols(dyb, 1 / mu_zz)
+    p11 = -dxf_inv_eps_zz.dot(dyb)
+    p12 = dxf_inv_eps_zz.dot(dxb) + sp.diags(mu_yy)
+    p21 = -dyf_inv_eps_zz.dot(dyb) - sp.diags(mu_xx)
+    p22 = dyf_inv_eps_zz.dot(dxb)
+    q11 = -dxb_inv_mu_zz.dot(dyf)
+    q12 = dxb_inv_mu_zz.dot(dxf) + sp.diags(eps_yy)
+    q21 = -dyb_inv_mu_zz.dot(dyf) - sp.diags(eps_xx)
+    q22 = dyb_inv_mu_zz.dot(dxf)
 
     pmat = sp.bmat([[p11, p12], [p21, p22]])
     qmat = sp.bmat([[q11, q12], [q21, q22]])
@@ -301,56 +362,35 @@ def solver_tensorial(eps, mu, der_mats, num_modes, neff_guess):
     dxf, dxb, dyf, dyb = der_mats
 
     # Compute all blocks of the matrix for diagonalization
-    inv_eps_zz = sp.spdiags(1 / eps[2, 2, :], [0], N, N)
-    inv_mu_zz = sp.spdiags(1 / mu[2, 2, :], [0], N, N)
-    axax = -dxf.dot(sp.spdiags(eps[2, 0, :] / eps[2, 2, :], [0], N, N)) - sp.spdiags(
-        mu[1, 2, :] / mu[2, 2, :], [0], N, N
-    ).dot(dyf)
-    axay = -dxf.dot(sp.spdiags(eps[2, 1, :] / eps[2, 2, :], [0], N, N)) + sp.spdiags(
-        mu[1, 2, :] / mu[2, 2, :], [0], N, N
-    ).dot(dxf)
-    axbx = -dxf.dot(inv_eps_zz).dot(dyb) + sp.spdiags(
-        mu[1, 0, :] - mu[1, 2, :] * mu[2, 0, :] / mu[2, 2, :], [0], N, N
-    )
-    axby = dxf.dot(inv_eps_zz).dot(dxb) + sp.spdiags(
-        mu[1, 1, :] - mu[1, 2, :] * mu[2, 1, :] / mu[2, 2, :], [0], N, N
-    )
-    ayax = -dyf.dot(sp.spdiags(eps[2, 0, :] / eps[2, 2, :], [0], N, N)) + sp.spdiags(
-        mu[0, 2, :] / mu[2, 2, :], [0], N, N
-    ).dot(dyf)
-    ayay = -dyf.dot(sp.spdiags(eps[2, 1, :] / eps[2, 2, :], [0], N, N)) - sp.spdiags(
-        mu[0, 2, :] / mu[2, 2, :], [0], N, N
-    ).dot(dxf)
-    aybx = -dyf.dot(inv_eps_zz).dot(dyb) + sp.spdiags(
-        -mu[0, 0, :] + mu[0, 2, :] * mu[2, 0, :] / mu[2, 2, :], [0], N, N
-    )
-    ayby = dyf.dot(inv_eps_zz).dot(dxb) + sp.spdiags(
-        -mu[0, 1, :] + mu[0, 2, :] * mu[2, 1, :] / mu[2, 2, :], [0], N, N
-    )
-    bxbx = -dxb.dot(sp.spdiags(mu[2, 0, :] / mu[2, 2, :], [0], N, N)) - sp.spdiags(
-        eps[1, 2, :] / eps[2, 2, :], [0], N, N
-    ).dot(dyb)
-    bxby = -dxb.dot(sp.spdiags(mu[2, 1, :] / mu[2, 2, :], [0], N, N)) + sp.spdiags(
-        eps[1, 2, :] / eps[2, 2, :], [0], N, N
-    ).dot(dxb)
-    bxax = -dxb.dot(inv_mu_zz).dot(dyf) + sp.spdiags(
-        eps[1, 0, :] - eps[1, 2, :] * eps[2, 0, :] / eps[2, 2, :], [0], N, N
-    )
-    bxay = dxb.dot(inv_mu_zz).dot(dxf) + sp.spdiags(
-        eps[1, 1, :] - eps[1, 2, :] * eps[2, 1, :] / eps[2, 2, :], [0], N, N
-    )
-    bybx = -dyb.dot(sp.spdiags(mu[2, 0, :] / mu[2, 2, :], [0], N, N)) + sp.spdiags(
-        eps[0, 2, :] / eps[2, 2, :], [0], N, N
-    ).dot(dyb)
-    byby = -dyb.dot(sp.spdiags(mu[2, 1, :] / mu[2, 2, :], [0], N, N)) - sp.spdiags(
-        eps[0, 2, :] / eps[2, 2, :], [0], N, N
-    ).dot(dxb)
-    byax = -dyb.dot(inv_mu_zz).dot(dyf) + sp.spdiags(
-        -eps[0, 0, :] + eps[0, 2, :] * eps[2, 0, :] / eps[2, 2, :], [0], N, N
-    )
-    byay = dyb.dot(inv_mu_zz).dot(dxf) + sp.spdiags(
-        -eps[0, 1, :] + eps[0, 2, :] * eps[2, 1, :] / eps[2, 2, :], [0], N, N
-    )
+    inv_eps_zz = sp.diags(1 / eps[2, 2, :])
+    inv_mu_zz = sp.diags(1 / mu[2, 2, :])
+    # Each derivative scaled by 1 / eps_zz or 1 / mu_zz is used in two blocks, so compute it once
+    dxf_inv_eps_zz = scale_cols(dxf, 1 / eps[2, 2, :])
+    dyf_inv_eps_zz = scale_cols(dyf, 1 / eps[2, 2, :])
+    dxb_inv_mu_zz = scale_cols(dxb, 1 / mu[2, 2, :])
+    dyb_inv_mu_zz = scale_cols(dyb, 1 / mu[2, 2, :])
+    # Ratios of the off-diagonal components to the zz component, each used in several blocks
+    eps_xz, eps_yz = eps[0, 2, :] / eps[2, 2, :], eps[1, 2, :] / eps[2, 2, :]
+    eps_zx, eps_zy = eps[2, 0, :] / eps[2, 2, :], eps[2, 1, :] / eps[2, 2, :]
+    mu_xz, mu_yz = mu[0, 2, :] / mu[2, 2, :], mu[1, 2, :] / mu[2, 2, :]
+    mu_zx, mu_zy = mu[2, 0, :] / mu[2, 2, :], mu[2, 1, :] / mu[2, 2, :]
+
+    axax = -scale_cols(dxf, eps_zx) - sp.diags(mu_yz).dot(dyf)
+    axay = -scale_cols(dxf, eps_zy) + sp.diags(mu_yz).dot(dxf)
+    axbx = -dxf_inv_eps_zz.dot(dyb) + sp.diags(mu[1, 0, :] - mu[1, 2, :] * mu_zx)
+    axby = dxf_inv_eps_zz.dot(dxb) + sp.diags(mu[1, 1, :] - mu[1, 2, :] * mu_zy)
+    ayax = -scale_cols(dyf, eps_zx) + sp.diags(mu_xz).dot(dyf)
+    ayay = -scale_cols(dyf, eps_zy) - sp.diags(mu_xz).dot(dxf)
+    aybx = -dyf_inv_eps_zz.dot(dyb) + sp.diags(-mu[0, 0, :] + mu[0, 2, :] * mu_zx)
+    ayby = dyf_inv_eps_zz.dot(dxb) + sp.diags(-mu[0, 1, :] + mu[0, 2, :] * mu_zy)
+    bxbx = -scale_cols(dxb, mu_zx) - sp.diags(eps_yz).dot(dyb)
+    bxby = -scale_cols(dxb, mu_zy) + sp.diags(eps_yz).dot(dxb)
+    bxax = -dxb_inv_mu_zz.dot(dyf) + sp.diags(eps[1, 0, :] - eps[1, 2, :] * eps_zx)
+    bxay = dxb_inv_mu_zz.dot(dxf) + sp.diags(eps[1, 1, :] - eps[1, 2, :] * eps_zy)
+    bybx = -scale_cols(dyb, mu_zx) + sp.diags(eps_xz).dot(dyb)
+    byby = -scale_cols(dyb, mu_zy) - sp.diags(eps_xz).dot(dxb)
+    byax = -dyb_inv_mu_zz.dot(dyf) + sp.diags(-eps[0, 0, :] + eps[0, 2, :] * eps_zx)
+    byay = dyb_inv_mu_zz.dot(dxf) + sp.diags(-eps[0, 1, :] + eps[0, 2, :] * eps_zy)
 
     mat = sp.bmat(
         [
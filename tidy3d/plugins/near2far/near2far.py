@@ -5,12 +5,10 @@ import numpy as np
 import xarray as xr
 import pydantic
 
-from rich.progress import track
-
 from ...constants import C_0, ETA_0, HERTZ, MICROMETER
 from ...components.data import SimulationData, FieldData
 from ...components.monitor import FieldMonitor
-from ...components.types import Direction, Axis, Coordinate, ArrayLike
+from ...components.types import Direction, Axis, Coordinate, ArrayLike, Literal
 from ...components.medium import Medium
 from ...components.base import Tidy3dBaseModel
 from ...log import SetupError, ValidationError
@@ -18,10 +16,43 @@ from ...log import SetupError, ValidationError
 # Default number of points per wavelength in the background medium to use for resampling fields.
 PTS_PER_WVL = 10
 
+# Number of observation directions for which the surface integrals are evaluated together; the
+# phase tables grow with the number of directions, so larger requests are split into blocks.
+DIRECTIONS_PER_BLOCK = 4096
+
 # Numpy float array and related array types
 ArrayLikeN2F = Union[float, List[float], ArrayLike]
 
 
+def _trapz_weights(pts: np.ndarray) -> np.ndarray:
+    """Weights ``w`` such that ``np.sum(w * f)`` equals ``np.trapz(f, pts)`` for any ``f``."""
+    weights = np.zeros(len(pts))
+    if len(pts) > 1:
+        steps = np.diff(pts) / 2
+        weights[:-1] += steps
+        weights[1:] += steps
+    return weights
+
+
+def _phase_table(phase_factor: complex, pts: np.ndarray, k_hat_dim: np.ndarray) -> np.ndarray:
+    """Returns ``np.exp(phase_factor * np.multiply.outer(pts, k_hat_dim))``. When ``pts``
+    are uniformly spaced, as for the resampled surface currents, consecutive rows differ by the
+    same factor, so the table is built by repeated multiplication with a single exponential
+    instead of taking the exponential of every element. For only a few directions, the direct
+    exponential is cheaper than the loop over rows."""
+    if len(pts) > 2 and k_hat_dim.size >= 100:
+        steps = np.diff(pts)
+        if np.allclose(steps, steps[0], rtol=1e-8, atol=0):
+            phase = np.empty((len(pts), *k_hat_dim.shape), dtype=complex)
+            phase[0] = np.exp(phase_factor * pts[0] * k_hat_dim)
+            phase_step = np.exp(phase_factor * (pts[-1] - pts[0]) / (len(pts) - 1) * k_hat_dim)
+            for index in range(1, len(pts)):
+                np.multiply(phase[index - 1], phase_step, out=phase[index])
+            return phase
+
+    return np.exp(phase_factor * np.multiply.outer(pts, k_hat_dim))
+
+
 class Near2FarSurface(Tidy3dBaseModel):
     """Data structure to store surface monitor data with associated surface current densities."""
 
@@ -111,6 +142,24 @@ class Near2Far(Tidy3dBaseModel):
         "Should not be changed except in special cases where the exp(-jkr) convention is used.",
     )
 
+    precision: Literal["double", "single"] = pydantic.Field(
+        "double",
+        title="Precision",
+        description="Floating point precision of the surface integrals. 'single' is faster and "
+        "uses half the memory, but the phase is only accurate to about 1e-7 times the largest "
+        "value of k * r over the surfaces.",
+    )
+
+    _surface_arrays: Dict[str, tuple] = pydantic.PrivateAttr(default_factory=dict)
+
+    """ explanation of ``_surface_arrays``
+        Maps each monitor name to the sample points relative to the local origin and the stacked,
+        integration-weighted tangential currents of its surface as plain numpy arrays, together
+        with the current ``xarray.Dataset``, origin and precision they were made with. They are
+        extracted on first use so that repeated projections do not go through xarray or recast the
+        currents, and are remade if ``currents``, ``origin`` or ``precision`` is replaced.
+    """
+
     @pydantic.validator("origin", always=True)
     def set_origin(cls, val, values):
         """Sets .origin as the average of centers of all surface monitors if not provided."""
@@ -156,6 +205,7 @@ class Near2Far(Tidy3dBaseModel):
         pts_per_wavelength: int = PTS_PER_WVL,
         medium: Medium = None,
         origin: Coordinate = None,
+        precision: Literal["double", "single"] = "double",
     ):
         """Constructs :class:`Near2Far` from a list of surface monitors and their directions.
 
@@ -180,6 +230,8 @@ class Near2Far(Tidy3dBaseModel):
         origin : :class:`.Coordinate`
             Local origin used for defining observation points. If ``None``, uses the
             average of the centers of all surface monitors.
+        precision : Literal["double", "single"] = "double"
+            Floating point precision of the surface integrals.
         """
 
         if len(monitors) != len(normal_dirs):
@@ -199,6 +251,7 @@ the number of directions ({len(normal_dirs)})."
             pts_per_wavelength=pts_per_wavelength,
             medium=medium,
             origin=origin,
+            precision=precision,
         )
 
     @pydantic.validator("currents", always=True)
@@ -284,7 +337,7 @@ the number of directions ({len(normal_dirs)})."
         """
 
         # figure out which field components are tangential or normal to the monitor
-        normal_field, tangent_fields = surface.monitor.pop_axis(("x", "y", "z"), axis=surface.axis)
+        _, tangent_fields = surface.monitor.pop_axis(("x", "y", "z"), axis=surface.axis)
 
         signs = np.array([-1, 1])
         if surface.axis % 2 != 0:
@@ -292,23 +345,23 @@ the number of directions ({len(normal_dirs)})."
         if surface.normal_dir == "-":
             signs *= -1
 
-        # compute surface current densities and delete unneeded field components
-        currents = field_data.copy(deep=True)
+        # compute surface current densities from the tangential field components only; the sign
+        # flip allocates the new values, and the shallow copies share everything else with the
+        # field data
         cmp_1, cmp_2 = tangent_fields
 
-        currents.data_dict["J" + cmp_2] = currents.data_dict.pop("H" + cmp_1)
-        currents.data_dict["J" + cmp_1] = currents.data_dict.pop("H" + cmp_2)
-        del currents.data_dict["H" + normal_field]
-
-        currents.data_dict["M" + cmp_2] = currents.data_dict.pop("E" + cmp_1)
-        currents.data_dict["M" + cmp_1] = currents.data_dict.pop("E" + cmp_2)
-        del currents.data_dict["E" + normal_field]
-
-        currents.data_dict["J" + cmp_1].values *= signs[0]
-        currents.data_dict["J" + cmp_2].values *= signs[1]
+        def signed_field(field_name: str, sign: int):
+            """Copy of a field component with its values multiplied by ``sign``."""
+            field = field_data.data_dict[field_name]
+            return field.copy(deep=False, update={"values": sign * field.values})
 
-        currents.data_dict["M" + cmp_1].values *= signs[1]
-        currents.data_dict["M" + cmp_2].values *= signs[0]
+        data_dict = {
+            "J" + cmp_1: signed_field("H" + cmp_2, signs[0]),
+            "J" + cmp_2: signed_field("H" + cmp_1, signs[1]),
+            "M" + cmp_1: signed_field("E" + cmp_2, signs[1]),
+            "M" + cmp_2: signed_field("E" + cmp_1, signs[0]),
+        }
+        currents = field_data.copy(deep=False, update={"data_dict": data_dict})
 
         return currents
 
@@ -382,140 +435,277 @@ the number of directions ({len(normal_dirs)})."
 
         return currents
 
-    # pylint:disable=too-many-locals
+    def _get_surface_arrays(
+        self, surface: Near2FarSurface, currents: xr.Dataset
+    ) -> Tuple[List[np.ndarray], np.ndarray]:
+        """Sample points relative to the local origin and the tangential currents, stacked as
+        ``J_u``, ``J_v``, ``M_u``, ``M_v``, multiplied by the trapezoidal integration weights and
+        cast to the working ``precision``, for a given surface. See ``_surface_arrays``."""
+
+        cached = self._surface_arrays.get(surface.monitor.name)
+        if (
+            cached is not None
+            and cached[0] is currents
+            and cached[1:3] == (self.origin, self.precision)
+        ):
+            return cached[3:]
+
+        # make sure that observation points are interpreted w.r.t. the local origin
+        pts = [
+            np.atleast_1d(currents[name].values - origin)
+            for name, origin in zip(["x", "y", "z"], self.origin)
+        ]
+
+        _, (idx_u, idx_v) = surface.monitor.pop_axis((0, 1, 2), axis=surface.axis)
+        _, (cmp_1, cmp_2) = surface.monitor.pop_axis(("x", "y", "z"), axis=surface.axis)
+
+        # order the axes as (u, v) explicitly; stacking copies them into one C-contiguous array
+        currents_stack = np.stack(
+            [
+                currents[name].transpose(cmp_1, cmp_2).values
+                for name in ("J" + cmp_1, "J" + cmp_2, "M" + cmp_1, "M" + cmp_2)
+            ]
+        )
+
+        # fold the trapezoidal integration weights into the currents once for all projections
+        currents_stack *= _trapz_weights(pts[idx_u])[:, None]
+        currents_stack *= _trapz_weights(pts[idx_v])[None, :]
+        if self.precision == "single":
+            currents_stack = currents_stack.astype(np.complex64)
+
+        self._surface_arrays[surface.monitor.name] = (
+            currents,
+            self.origin,
+            self.precision,
+            pts,
+            currents_stack,
+        )
+        return pts, currents_stack
+
+    # pylint:disable=too-many-locals, too-many-arguments
     def _radiation_vectors_for_surface(
-        self, theta: ArrayLikeN2F, phi: ArrayLikeN2F, surface: Near2FarSurface, currents: xr.Dataset
-    ):
-        """Compute radiation vectors at an angle in spherical coordinates
-        for a given set of surface currents and observation angles.
+        self,
+        propagation_factor: complex,
+        k_hat: List[np.ndarray],
+        surface: Near2FarSurface,
+        currents: xr.Dataset,
+        J: np.ndarray,
+        M: np.ndarray,
+        phase_cache: Dict[tuple, np.ndarray] = None,
+    ) -> None:
+        """Compute the surface integrals of the electric and magnetic currents for a given surface
+        and set of observation directions, and add them to ``J`` and ``M``.
 
         Parameters
         ----------
-        theta : Union[float, List[float], np.ndarray]
-            Polar angles (rad) downward from x=y=0 line relative to the local origin.
-        phi : Union[float, List[float], np.ndarray]
-            Azimuthal (rad) angles from y=z=0 line relative to the local origin.
+        propagation_factor : complex
+            Factor multiplying the projected distance in the exponent of the phase, given by the
+            phasor convention and the wave number of the background medium.
+        k_hat : np.ndarray
+            x, y and z components of the unit vector pointing in each observation direction, of
+            shape (3, N_directions).
         surface: :class:`Near2FarSurface`
             :class:`Near2FarSurface` object to use as source of near field.
         currents : xarray.Dataset
             xarray Dataset containing surface currents associated with the surface monitor.
+        J : np.ndarray
+            Cartesian components of the integral of the electric currents, of shape
+            (3, N_directions), to which the contribution of this surface is added.
+        M : np.ndarray
+            Same as ``J`` for the magnetic currents.
+        phase_cache : Dict[tuple, numpy.ndarray] = None
+            Phase factors already computed for the same ``k_hat``, keyed by axis and sample
+            points; new ones are added to it. Surfaces of a box share their sample points along
+            each tangential axis, so passing the same dictionary for all of them avoids
+            recomputing the exponentials.
+        """
+
+        pts, currents_stack = self._get_surface_arrays(surface, currents)
+        idx_w, (idx_u, idx_v) = surface.monitor.pop_axis((0, 1, 2), axis=surface.axis)
+        angles_shape = k_hat[0].shape
+
+        dtype = np.complex64 if self.precision == "single" else np.complex128
+
+        # phase factors along each axis for all observation angles, shape (N_pts, N_directions)
+        if phase_cache is None:
+            phase_cache = {}
+        phase = []
+        for dim, (pts_dim, k_hat_dim) in enumerate(zip(pts, k_hat)):
+            key = (dim, pts_dim.tobytes())
+            if key not in phase_cache:
+                phase_table = _phase_table(propagation_factor, pts_dim, k_hat_dim)
+                phase_cache[key] = phase_table.astype(dtype, copy=False)
+            phase.append(phase_cache[key])
+
+        # the phase is separable in u and v, so the v integral is a matrix product over the
+        # flattened angles for all currents and u points at once, followed by the u integral
+        num_u, num_v = currents_stack.shape[1:]
+        integral_v = currents_stack.reshape((4 * num_u, num_v)) @ phase[idx_v].reshape((num_v, -1))
+        integrals = np.einsum(
+            "ua,cua->ca", phase[idx_u].reshape((num_u, -1)), integral_v.reshape((4, num_u, -1))
+        )
+        integrals = integrals.reshape((4, *angles_shape))
+        integrals *= phase[idx_w][0]
+
+        # the currents are tangential, so only the u and v components receive a contribution
+        J[idx_u] += integrals[0]
+        J[idx_v] += integrals[1]
+        M[idx_u] += integrals[2]
+        M[idx_v] += integrals[3]
+
+    def _radiation_vectors(self, theta: ArrayLikeN2F, phi: ArrayLikeN2F):
+        """Compute radiation vectors at an angle in spherical coordinates.
+
+        Parameters
+        ----------
+        theta : Union[float, List[float], np.ndarray]
+            Polar angles (rad) downward from x=y=0 line relative to the local origin.
+        phi : Union[float, List[float], np.ndarray]
+            Azimuthal (rad) angles from y=z=0 line relative to the local origin.
 
         Returns
         -------
         tuple(numpy.ndarray[float],numpy.ndarray[float],numpy.ndarray[float],numpy.ndarray[float])
-            ``N_theta``, ``N_phi``, ``L_theta``, ``L_phi`` radiation vectors for the given surface.
+            ``N_theta``, ``N_phi``, ``L_theta``, ``L_phi`` radiation vectors.
         """
 
-        # make sure that observation points are interpreted w.r.t. the local origin
-        pts = [currents[name].values - origin for name, origin in zip(["x", "y", "z"], self.origin)]
+        theta = np.atleast_1d(theta)
+        phi = np.atleast_1d(phi)
 
-        idx_w, idx_uv = surface.monitor.pop_axis((0, 1, 2), axis=surface.axis)
-        _, source_names = surface.monitor.pop_axis(("x", "y", "z"), axis=surface.axis)
+        return self._radiation_vectors_at(theta[:, None], phi[None, :])
 
-        idx_u, idx_v = idx_uv
-        cmp_1, cmp_2 = source_names
+    def _radiation_vectors_at(self, theta: np.ndarray, phi: np.ndarray):
+        """Compute radiation vectors for observation directions given elementwise by ``theta`` and
+        ``phi``, which are broadcast against each other; ``_radiation_vectors`` passes them as a
+        column and a row to evaluate all of their combinations.
 
-        theta = np.atleast_1d(theta)
-        phi = np.atleast_1d(phi)
+        Parameters
+        ----------
+        theta : np.ndarray
+            Polar angles (rad) downward from x=y=0 line relative to the local origin.
+        phi : np.ndarray
+            Azimuthal (rad) angles from y=z=0 line relative to the local origin.
+
+        Returns
+        -------
+        tuple(numpy.ndarray[float],numpy.ndarray[float],numpy.ndarray[float],numpy.ndarray[float])
+            ``N_theta``, ``N_phi``, ``L_theta``, ``L_phi`` radiation vectors, with the broadcast
+            shape of ``theta`` and ``phi``.
+        """
+
+        angles_shape = np.broadcast(theta, phi).shape
 
         sin_theta = np.sin(theta)
         cos_theta = np.cos(theta)
         sin_phi = np.sin(phi)
         cos_phi = np.cos(phi)
 
-        J = np.zeros((3, len(theta), len(phi)), dtype=complex)
+        # unit vectors pointing in each observation direction, flattened over the directions
+        k_hat = np.stack(
+            [
+                np.broadcast_to(sin_theta * cos_phi, angles_shape),
+                np.broadcast_to(sin_theta * sin_phi, angles_shape),
+                np.broadcast_to(cos_theta, angles_shape),
+            ]
+        ).reshape((3, -1))
+
+        # integrate the currents of each monitor, accumulating the contributions in place; the
+        # medium is only evaluated once rather than for every surface
+        J = np.zeros(k_hat.shape, dtype=complex)
         M = np.zeros_like(J)
 
-        def integrate_2d(function, pts_u, pts_v):
-            """Trapezoidal integration in two dimensions."""
-            return np.trapz(np.trapz(function, pts_u, axis=0), pts_v, axis=0)
-
-        phase = [None] * 3
         propagation_factor = -self.phasor_positive_sign * 1j * self.k
-
-        def integrate_for_one_theta(i_th: int):
-            """Perform integration for a given theta angle index"""
-
-            for j_ph in np.arange(len(phi)):
-
-                phase[0] = np.exp(propagation_factor * pts[0] * sin_theta[i_th] * cos_phi[j_ph])
-                phase[1] = np.exp(propagation_factor * pts[1] * sin_theta[i_th] * sin_phi[j_ph])
-                phase[2] = np.exp(propagation_factor * pts[2] * cos_theta[i_th])
-
-                phase_ij = phase[idx_u][:, None] * phase[idx_v][None, :] * phase[idx_w]
-
-                J[idx_u, i_th, j_ph] = integrate_2d(
-                    currents["J" + cmp_1].values * phase_ij, pts[idx_u], pts[idx_v]
-                )
-                J[idx_v, i_th, j_ph] = integrate_2d(
-                    currents["J" + cmp_2].values * phase_ij, pts[idx_u], pts[idx_v]
-                )
-
-                M[idx_u, i_th, j_ph] = integrate_2d(
-                    currents["M" + cmp_1].values * phase_ij, pts[idx_u], pts[idx_v]
-                )
-                M[idx_v, i_th, j_ph] = integrate_2d(
-                    currents["M" + cmp_2].values * phase_ij, pts[idx_u], pts[idx_v]
+        for start in range(0, k_hat.shape[1], DIRECTIONS_PER_BLOCK):
+            block = slice(start, start + DIRECTIONS_PER_BLOCK)
+            phase_cache = {}
+            for surface in self.surfaces:
+                currents = self.currents[surface.monitor.name]
+                self._radiation_vectors_for_surface(
+                    propagation_factor,
+                    k_hat[:, block],
+                    surface,
+                    currents,
+                    J[:, block],
+                    M[:, block],
+                    phase_cache,
                 )
 
-        if len(theta) < 2:
-            integrate_for_one_theta(0)
-        else:
-            for i_th in track(
-                np.arange(len(theta)),
-                description=f"Processing surface monitor '{surface.monitor.name}'...",
-            ):
-                integrate_for_one_theta(i_th)
+        J = J.reshape((3, *angles_shape))
+        M = M.reshape((3, *angles_shape))
 
-        cos_th_cos_phi = cos_theta[:, None] * cos_phi[None, :]
-        cos_th_sin_phi = cos_theta[:, None] * sin_phi[None, :]
+        # project the summed integrals onto the spherical unit vectors once for all surfaces
+        cos_th_cos_phi = cos_theta * cos_phi
+        cos_th_sin_phi = cos_theta * sin_phi
 
         # N_theta (8.33a)
-        N_theta = J[0] * cos_th_cos_phi + J[1] * cos_th_sin_phi - J[2] * sin_theta[:, None]
+        N_theta = J[0] * cos_th_cos_phi + J[1] * cos_th_sin_phi - J[2] * sin_theta
 
         # N_phi (8.33b)
-        N_phi = -J[0] * sin_phi[None, :] + J[1] * cos_phi[None, :]
+        N_phi = -J[0] * sin_phi + J[1] * cos_phi
 
         # L_theta  (8.34a)
-        L_theta = M[0] * cos_th_cos_phi + M[1] * cos_th_sin_phi - M[2] * sin_theta[:, None]
+        L_theta = M[0] * cos_th_cos_phi + M[1] * cos_th_sin_phi - M[2] * sin_theta
 
         # L_phi  (8.34b)
-        L_phi = -M[0] * sin_phi[None, :] + M[1] * cos_phi[None, :]
+        L_phi = -M[0] * sin_phi + M[1] * cos_phi
 
         return N_theta, N_phi, L_theta, L_phi
 
-    def _radiation_vectors(self, theta: ArrayLikeN2F, phi: ArrayLikeN2F):
-        """Compute radiation vectors at an angle in spherical coordinates.
+    def _fields_spherical_at(
+        self, r: ArrayLikeN2F, theta: np.ndarray, phi: np.ndarray
+    ) -> Tuple[np.ndarray, ...]:
+        """Fields in spherical coordinates at points given elementwise by ``r``, ``theta`` and
+        ``phi``, which are broadcast against each other.
 
         Parameters
         ----------
-        theta : Union[float, List[float], np.ndarray]
-            Polar angles (rad) downward from x=y=0 line relative to the local origin.
-        phi : Union[float, List[float], np.ndarray]
-            Azimuthal (rad) angles from y=z=0 line relative to the local origin.
+        r : Union[float, np.ndarray]
+            (micron) radial distances relative to the local origin.
+        theta : np.ndarray
+            (radian) polar angles downward from x=y=0 relative to the local origin.
+        phi : np.ndarray
+            (radian) azimuthal angles from y=z=0 line relative to the local origin.
 
         Returns
         -------
-        tuple(numpy.ndarray[float],numpy.ndarray[float],numpy.ndarray[float],numpy.ndarray[float])
-            ``N_theta``, ``N_phi``, ``L_theta``, ``L_phi`` radiation vectors.
+        Tuple[np.ndarray, ...]
+            ``E_r``, ``E_theta``, ``E_phi``, ``H_r``, ``H_theta``, ``H_phi`` at each point.
         """
 
-        # compute radiation vectors for the dataset associated with each monitor
-        N_theta = np.zeros((len(theta), len(phi)), dtype=complex)
-        N_phi = np.zeros_like(N_theta)
-        L_theta = np.zeros_like(N_theta)
-        L_phi = np.zeros_like(N_theta)
+        # project radiation vectors to distance r away for given angles
+        N_theta, N_phi, L_theta, L_phi = self._radiation_vectors_at(theta, phi)
 
-        for surface in self.surfaces:
-            _N_th, _N_ph, _L_th, _L_ph = self._radiation_vectors_for_surface(
-                theta, phi, surface, self.currents[surface.monitor.name]
-            )
-            N_theta += _N_th
-            N_phi += _N_ph
-            L_theta += _L_th
-            L_phi += _L_ph
+        k = self.k
+        eta = self.eta
 
-        return N_theta, N_phi, L_theta, L_phi
+        scalar_proj_r = (
+            -self.phasor_positive_sign
+            * 1j
+            * k
+            * np.exp(self.phasor_positive_sign * 1j * k * r)
+            / (4 * np.pi * r)
+        )
+
+        # assemble E felds
+        Et_array = -scalar_proj_r * (L_phi + eta * N_theta)
+        Ep_array = scalar_proj_r * (L_theta - eta * N_phi)
+        Er_array = np.zeros_like(Ep_array)
+
+        # assemble H fields
+        Ht_array = -Ep_array / eta
+        Hp_array = Et_array / eta
+        Hr_array = np.zeros_like(Hp_array)
+
+        return Er_array, Et_array, Ep_array, Hr_array, Ht_array, Hp_array
+
+    @staticmethod
+    def _power_from_fields(
+        e_theta: np.ndarray, e_phi: np.ndarray, h_theta: np.ndarray, h_phi: np.ndarray
+    ) -> np.ndarray:
+        """Radial power flux density given the tangential fields in spherical coordinates."""
+        power_theta = 0.5 * np.real(e_theta * np.conj(h_phi))
+        power_phi = 0.5 * np.real(-e_phi * np.conj(h_theta))
+        return power_theta + power_phi
 
     def fields_spherical(self, r: float, theta: ArrayLikeN2F, phi: ArrayLikeN2F) -> xr.Dataset:
         """Get fields at a point relative to monitor center in spherical coordinates.
@@ -539,30 +729,10 @@ the number of directions ({len(normal_dirs)})."
         theta = np.atleast_1d(theta)
         phi = np.atleast_1d(phi)
 
-        # project radiation vectors to distance r away for given angles
-        N_theta, N_phi, L_theta, L_phi = self._radiation_vectors(theta, phi)
-
-        k = self.k
-        eta = self.eta
-
-        scalar_proj_r = (
-            -self.phasor_positive_sign
-            * 1j
-            * k
-            * np.exp(self.phasor_positive_sign * 1j * k * r)
-            / (4 * np.pi * r)
+        Er_array, Et_array, Ep_array, Hr_array, Ht_array, Hp_array = self._fields_spherical_at(
+            r, theta[:, None], phi[None, :]
         )
 
-        # assemble E felds
-        Et_array = -scalar_proj_r * (L_phi + eta * N_theta)
-        Ep_array = scalar_proj_r * (L_theta - eta * N_phi)
-        Er_array = np.zeros_like(Ep_array)
-
-        # assemble H fields
-        Ht_array = -Ep_array / eta
-        Hp_array = Et_array / eta
-        Hr_array = np.zeros_like(Hp_array)
-
         dims = ("r", "theta", "phi")
         coords = {"r": [r], "theta": theta, "phi": phi}
 
@@ -600,33 +770,12 @@ the number of directions ({len(normal_dirs)})."
 
         x, y, z = [np.atleast_1d(x), np.atleast_1d(y), np.atleast_1d(z)]
 
-        Ex_data = np.zeros((len(x), len(y), len(z)), dtype=complex)
-        Ey_data = np.zeros_like(Ex_data)
-        Ez_data = np.zeros_like(Ex_data)
-
-        Hx_data = np.zeros_like(Ex_data)
-        Hy_data = np.zeros_like(Ex_data)
-        Hz_data = np.zeros_like(Ex_data)
-
-        for i in track(np.arange(len(x)), description="Computing far fields"):
-            _x = x[i]
-            for j in np.arange(len(y)):
-                _y = y[j]
-                for k in np.arange(len(z)):
-                    _z = z[k]
+        # evaluate all points of the grid at once, broadcasting the coordinates against each other
+        r, theta, phi = self._car_2_sph(x[:, None, None], y[None, :, None], z[None, None, :])
+        Er, Et, Ep, Hr, Ht, Hp = self._fields_spherical_at(r, theta, phi)
 
-                    r, theta, phi = self._car_2_sph(_x, _y, _z)
-                    _field_data = self.fields_spherical(r, theta, phi)
-
-                    Er, Et, Ep = [_field_data[comp].values for comp in ["E_r", "E_theta", "E_phi"]]
-                    Hr, Ht, Hp = [_field_data[comp].values for comp in ["H_r", "H_theta", "H_phi"]]
-
-                    Ex_data[i, j, k], Ey_data[i, j, k], Ez_data[i, j, k] = self._sph_2_car_field(
-                        Er, Et, Ep, theta, phi
-                    )
-                    Hx_data[i, j, k], Hy_data[i, j, k], Hz_data[i, j, k] = self._sph_2_car_field(
-                        Hr, Ht, Hp, theta, phi
-                    )
+        Ex_data, Ey_data, Ez_data = self._sph_2_car_field(Er, Et, Ep, theta, phi)
+        Hx_data, Hy_data, Hz_data = self._sph_2_car_field(Hr, Ht, Hp, theta, phi)
 
         dims = ("x", "y", "z")
         coords = {"x": x, "y": y, "z": z}
@@ -667,9 +816,7 @@ the number of directions ({len(normal_dirs)})."
         field_data = self.fields_spherical(r, theta, phi)
         Et, Ep = [field_data[comp].values for comp in ["E_theta", "E_phi"]]
         Ht, Hp = [field_data[comp].values for comp in ["H_theta", "H_phi"]]
-        power_theta = 0.5 * np.real(Et * np.conj(Hp))
-        power_phi = 0.5 * np.real(-Ep * np.conj(Ht))
-        power_data = power_theta + power_phi
+        power_data = self._power_from_fields(Et, Ep, Ht, Hp)
 
         dims = ("r", "theta", "phi")
         coords = {"r": [r], "theta": theta, "phi": phi}
@@ -696,17 +843,10 @@ the number of directions ({len(normal_dirs)})."
 
         x, y, z = [np.atleast_1d(x), np.atleast_1d(y), np.atleast_1d(z)]
 
-        power_data = np.zeros((len(x), len(y), len(z)))
-
-        for i in track(np.arange(len(x)), description="Computing far field power"):
-            _x = x[i]
-            for j in np.arange(len(y)):
-                _y = y[j]
-                for k in np.arange(len(z)):
-                    _z = z[k]
-
-                    r, theta, phi = self._car_2_sph(_x, _y, _z)
-                    power_data[i, j, k] = self.power_spherical(r, theta, phi).values
+        # evaluate all points of the grid at once, broadcasting the coordinates against each other
+        r, theta, phi = self._car_2_sph(x[:, None, None], y[None, :, None], z[None, None, :])
+        _, Et, Ep, _, Ht, Hp = self._fields_spherical_at(r, theta, phi)
+        power_data = self._power_from_fields(Et, Ep, Ht, Hp)
 
         dims = ("x", "y", "z")
         coords = {"x": x, "y": y, "z": z}
@@ -759,20 +899,22 @@ the number of directions ({len(normal_dirs)})."
         """
         Parameters
         ----------
-        x : float
-            x coordinate.
-        y : float
-            y coordinate.
-        z : float
-            z coordinate.
+        x : Union[float, np.ndarray]
+            x coordinates.
+        y : Union[float, np.ndarray]
+            y coordinates.
+        z : Union[float, np.ndarray]
+            z coordinates.
 
         Returns
         -------
         tuple
-            r, theta, and phi in spherical coordinates.
+            r, theta, and phi in spherical coordinates, broadcast over the inputs.
         """
-        r = np.sqrt(x**2 + y**2 + z**2)
-        theta = np.arccos(z / r)
+        # arctan2 stays accurate near the poles, where arccos(z / r) loses precision
+        r_xy = np.hypot(x, y)
+        r = np.hypot(r_xy, z)
+        theta = np.arctan2(r_xy, z)
         phi = np.arctan2(y, x)
         return r, theta, phi
 
@@ -826,7 +968,9 @@ the number of directions ({len(normal_dirs)})."
         cos_theta = np.cos(theta)
         sin_phi = np.sin(phi)
         cos_phi = np.cos(phi)
-        Ax = Ar * sin_theta * cos_phi + Atheta * cos_theta * cos_phi - Aphi * sin_phi
-        Ay = Ar * sin_theta * sin_phi + Atheta * cos_theta * sin_phi + Aphi * cos_phi
+        # component in the xy-plane along phi, shared by Ax and Ay
+        a_rho = Ar * sin_theta + Atheta * cos_theta
+        Ax = a_rho * cos_phi - Aphi * sin_phi
+        Ay = a_rho * sin_phi + Aphi * cos_phi
         Az = Ar * cos_theta - Atheta * sin_theta
         return Ax, Ay, Az